@@ -7,22 +7,41 @@ This module creates and configures the Flask application using the application f
 import os
 import sys
 import logging
-from typing import Optional
-from flask import Flask
+from logging.handlers import MemoryHandler
+from typing import Callable, Optional
+from flask import Flask, request, url_for
+from sqlalchemy import event
+from werkzeug.middleware.shared_data import SharedDataMiddleware
 
 from .config import Config
-from .routes.players import players_bp
-from .routes.sessions import sessions_bp
-from .routes.chip_calculator import chip_calculator_bp
-from .routes.frontend import frontend_bp
-from .routes.admin import admin_bp
-from .routes.dashboard import dashboard_bp
-from .routes.notifications import notifications_bp
-from .routes.config import config_bp
-from .routes.stats import stats_bp
-from .routes.calendar import calendar_bp
-from .database.models import db
+from .database.models import db, set_sqlite_pragmas
 from .database.migrations import AutoMigration
+from .utils.cache import init_response_cache, invalidate_response_cache
+from .utils.json_provider import OrjsonProvider, orjson
+
+# Add scripts directory to Python path for importing chip_calculator. The
+# directory is fixed, so this is done once on import rather than per app.
+_SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
+
+# Security headers added to every response. The Content Security Policy
+# allows the necessary sources while being secure.
+SECURITY_HEADERS = {
+    'Content-Security-Policy': (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
+        "style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
+        "font-src 'self' https://cdnjs.cloudflare.com; "
+        "img-src 'self' data:; "
+        "connect-src 'self' https://cdnjs.cloudflare.com; "
+        "manifest-src 'self'; "
+        "worker-src 'self'"
+    ),
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block'
+}
 
 
 def create_app(config_class: type = Config) -> Flask:
@@ -35,11 +54,6 @@ def create_app(config_class: type = Config) -> Flask:
     Returns:
         Configured Flask application instance
     """
-    # Add scripts directory to Python path for importing chip_calculator
-    scripts_dir = os.path.join(os.path.dirname(__file__), '..', 'scripts')
-    if scripts_dir not in sys.path:
-        sys.path.append(scripts_dir)
-    
     # Initialize and apply configuration first
     config = config_class()
     
@@ -48,10 +62,23 @@ def create_app(config_class: type = Config) -> Flask:
                 template_folder=config.TEMPLATE_DIR,
                 static_folder=config.STATIC_DIR)
     
-    # Apply configuration
-    for key, value in vars(config).items():
-        if not key.startswith('_'):
-            app.config[key] = value
+    # Serve /static straight from the WSGI layer so asset requests skip
+    # Flask's routing and request handling. Flask's static route stays
+    # registered so url_for('static', ...) keeps working.
+    app.wsgi_app = SharedDataMiddleware(
+        app.wsgi_app,
+        {app.static_url_path: config.STATIC_DIR},
+        cache_timeout=config.STATIC_CACHE_TIMEOUT
+    )
+    # Static responses skip after_request, so add the security headers here
+    app.wsgi_app = static_security_headers(app.wsgi_app, app.static_url_path)
+    
+    # Use orjson for jsonify and request parsing when it is installed
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    
+    # Apply configuration (uppercase instance and class attributes)
+    app.config.from_object(config)
     
     # Configure logging
     setup_logging(app)
@@ -61,68 +88,139 @@ def create_app(config_class: type = Config) -> Flask:
     
     # Create database tables if they don't exist
     with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
+            # Let gunicorn workers see each other's cache invalidations
+            if db.engine.url.database and db.engine.url.database != ':memory:':
+                init_response_cache(app, db.engine.url.database + '.cache-stamp')
         db.create_all()
         # Run auto-migrations to handle schema updates
         AutoMigration.run_auto_migrations(app)
     
-    # Register blueprints
-    app.register_blueprint(dashboard_bp, url_prefix='/api')
-    app.register_blueprint(players_bp, url_prefix='/api')
-    app.register_blueprint(sessions_bp, url_prefix='/api')
-    app.register_blueprint(chip_calculator_bp, url_prefix='/api')
-    app.register_blueprint(notifications_bp, url_prefix='/api/notifications')
-    app.register_blueprint(config_bp, url_prefix='/api')
-    app.register_blueprint(stats_bp)
-    app.register_blueprint(calendar_bp, url_prefix='/api')
-    app.register_blueprint(admin_bp, url_prefix='/admin')
-    app.register_blueprint(frontend_bp)
-    
-    # Add context processor for versioned static URLs
+    # Register blueprints. The route modules (and the notification service
+    # they pull in) are imported here rather than at module level, so tools
+    # that only need app.database or app.config don't load them.
+    from .routes.players import players_bp
+    from .routes.sessions import sessions_bp
+    from .routes.chip_calculator import chip_calculator_bp
+    from .routes.frontend import frontend_bp
+    from .routes.admin import admin_bp
+    from .routes.dashboard import dashboard_bp
+    from .routes.notifications import notifications_bp
+    from .routes.config import config_bp
+    from .routes.stats import stats_bp
+    from .routes.calendar import calendar_bp
+    
+    blueprints = (
+        (dashboard_bp, '/api'),
+        (players_bp, '/api'),
+        (sessions_bp, '/api'),
+        (chip_calculator_bp, '/api'),
+        (notifications_bp, '/api/notifications'),
+        (config_bp, '/api'),
+        (stats_bp, None),
+        (calendar_bp, '/api'),
+        (admin_bp, '/admin'),
+        (frontend_bp, None),
+    )
+    for blueprint, url_prefix in blueprints:
+        app.register_blueprint(blueprint, url_prefix=url_prefix)
+    
+    # Add context processor for versioned static URLs. The static prefix and
+    # version query string are resolved once here so rendering a template
+    # doesn't go through url_for rule resolution for every asset.
+    with app.test_request_context():
+        static_prefix = url_for('static', filename='')
+    static_version_qs = f"?v={app.config.get('APP_VERSION', '1.0.0')}"
+
+    def versioned_url(filename):
+        return f"{static_prefix}{filename}{static_version_qs}"
+
+    versioned_context = dict(versioned_url=versioned_url)
+
     @app.context_processor
     def versioned_static():
-        def versioned_url(filename):
-            from flask import url_for
-            return url_for('static', filename=filename, v=app.config.get('APP_VERSION', '1.0.0'))
-        return dict(versioned_url=versioned_url)
+        return versioned_context
+    
+    # Drop cached GET responses after every write request. The status code
+    # doesn't tell whether a commit happened (removing a player's last
+    # buy-in deletes the entry and still answers 400), so it isn't checked.
+    @app.after_request
+    def invalidate_cached_responses(response):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            invalidate_response_cache()
+        return response
     
     # Add security headers
     @app.after_request
     def add_security_headers(response):
-        # Content Security Policy that allows necessary sources while being secure
-        csp_policy = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
-            "style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; "
-            "font-src 'self' https://cdnjs.cloudflare.com; "
-            "img-src 'self' data:; "
-            "connect-src 'self' https://cdnjs.cloudflare.com; "
-            "manifest-src 'self'; "
-            "worker-src 'self'"
-        )
-        response.headers['Content-Security-Policy'] = csp_policy
-        
-        # Other security headers
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        
+        response.headers.update(SECURITY_HEADERS)
         return response
     
     return app
 
 
+def static_security_headers(wsgi_app: Callable, static_url_path: str) -> Callable:
+    """
+    Wrap a WSGI app so responses under the static path carry SECURITY_HEADERS.
+    
+    Headers the response already sets (e.g. a 404 that fell through to
+    Flask) are left alone.
+    
+    Args:
+        wsgi_app: WSGI application to wrap
+        static_url_path: URL prefix static files are served from
+        
+    Returns:
+        Wrapped WSGI application
+    """
+    prefix = static_url_path.rstrip('/') + '/'
+    
+    def middleware(environ, start_response):
+        if not environ.get('PATH_INFO', '').startswith(prefix):
+            return wsgi_app(environ, start_response)
+        
+        def start_response_with_headers(status, headers, exc_info=None):
+            present = {name.lower() for name, _ in headers}
+            headers.extend(
+                (name, value) for name, value in SECURITY_HEADERS.items()
+                if name.lower() not in present
+            )
+            return start_response(status, headers, exc_info)
+        
+        return wsgi_app(environ, start_response_with_headers)
+    
+    return middleware
+
+
 def setup_logging(app: Flask) -> None:
     """
     Configure application logging.
     
+    Records for the log file are buffered and written in batches; a
+    warning or error flushes the buffer straight away, and logging's
+    shutdown hook flushes whatever is left when the process exits.
+    
+    Logging is process-wide, so it is only configured by the first app
+    created in a process.
+    
     Args:
         app: Flask application instance
     """
+    if logging.getLogger().handlers:
+        return
+    
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
+    # basicConfig only formats the handlers it is given, not the buffer's target
+    file_handler = logging.FileHandler('poker_app.log')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler('poker_app.log'),
+            MemoryHandler(capacity=100, flushLevel=logging.WARNING, target=file_handler),
             logging.StreamHandler()
         ]
     )
@@ -5,8 +5,66 @@ This module handles application configuration including path calculations and en
 """
 
 import os
+import re
+from functools import lru_cache
 from typing import Optional
 
+# Matches an uncommented ADMIN_PASSWORD_HASH=... line in a .env file
+_ADMIN_HASH_RE = re.compile(rb'^[ \t]*ADMIN_PASSWORD_HASH[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
+
+@lru_cache(maxsize=8)
+def _read_version(path: str, mtime: float) -> Optional[str]:
+    """
+    Read the version string from a version.txt file.
+    
+    The file's mtime is part of the cache key, so building another Config
+    reuses the parsed value until the file is edited.
+    
+    Args:
+        path: Path to version.txt
+        mtime: Modification time of the file
+        
+    Returns:
+        Version string, or None if the file is empty
+    """
+    with open(path, 'r') as f:
+        return f.read().strip() or None
+
+
+@lru_cache(maxsize=8)
+def _read_admin_hash(path: str, mtime: float) -> Optional[str]:
+    """
+    Read ADMIN_PASSWORD_HASH from a .env file.
+    
+    Cached by path and mtime like _read_version.
+    
+    Args:
+        path: Path to the .env file
+        mtime: Modification time of the file
+        
+    Returns:
+        Configured hash, or None if the file doesn't set one
+    """
+    with open(path, 'rb') as f:
+        match = _ADMIN_HASH_RE.search(f.read())
+    return match.group(1).decode('utf-8') if match else None
+
+
+@lru_cache(maxsize=1)
+def default_admin_password_hash() -> str:
+    """
+    Hash the default 'admin123' admin password.
+    
+    Used when no ADMIN_PASSWORD_HASH is configured. Hashing is deliberately
+    slow, so it runs on the first admin login rather than at start-up.
+    
+    Returns:
+        Password hash for 'admin123'
+    """
+    from werkzeug.security import generate_password_hash
+    return generate_password_hash('admin123')
+
 
 class Config:
     """Base configuration class for the application."""
@@ -25,6 +83,10 @@ class Config:
         self.FRONTEND_DIR = os.path.join(self.PROJECT_ROOT, 'frontend')
         self.STATIC_DIR = os.path.join(self.FRONTEND_DIR, 'static')
         self.TEMPLATE_DIR = os.path.join(self.FRONTEND_DIR, 'templates')
+        
+        # Browser cache lifetime for /static. ES module imports aren't
+        # versioned, so assets are revalidated (ETag) rather than cached.
+        self.STATIC_CACHE_TIMEOUT = 0
     
     def _setup_database_config(self) -> None:
         """Set up database configuration."""
@@ -40,53 +102,45 @@ class Config:
         # Session security
         self.SECRET_KEY = os.environ.get('SECRET_KEY', 'poker-night-admin-secret-key-change-in-production')
         
+        # Reject oversized request bodies before they reach a route
+        self.MAX_CONTENT_LENGTH = 16 * 1024
+        
     def _load_app_version(self) -> None:
         """Load APP_VERSION from root version.txt file."""
         version_file_path = os.path.join(self.PROJECT_ROOT, 'version.txt')
         self.APP_VERSION = '1.0.0'  # Default fallback version
 
         try:
-            with open(version_file_path, 'r') as f:
-                version = f.read().strip()
-                if version:
-                    self.APP_VERSION = version
+            version = _read_version(version_file_path, os.path.getmtime(version_file_path))
+            if version:
+                self.APP_VERSION = version
         except FileNotFoundError:
             import logging
             logger = logging.getLogger(__name__)
-            logger.warning(f"version.txt file not found at {version_file_path}, using default version")
+            logger.warning("version.txt file not found at %s, using default version", version_file_path)
         except Exception as e:
             import logging
             logger = logging.getLogger(__name__)
-            logger.warning(f"Error reading version.txt file: {e}")
+            logger.warning("Error reading version.txt file: %s", e)
     
     def _load_admin_config(self) -> None:
         """Load admin configuration from environment variables and .env file."""
-        # Try to load from root .env file first
+        # The environment variable takes priority. The entry points load
+        # .env into the environment already, so the file is only read here
+        # when the variable isn't set.
+        admin_password_hash = os.environ.get('ADMIN_PASSWORD_HASH')
         root_env_file = os.path.join(self.PROJECT_ROOT, '.env')
-        admin_password_hash = None
         
-        if os.path.exists(root_env_file):
+        if admin_password_hash is None and os.path.exists(root_env_file):
             try:
-                with open(root_env_file, 'r') as f:
-                    for line in f:
-                        if line.strip() and not line.strip().startswith('#'):
-                            if '=' in line:
-                                key, value = line.strip().split('=', 1)
-                                if key.strip() == 'ADMIN_PASSWORD_HASH':
-                                    admin_password_hash = value.strip()
-                                    break
+                admin_password_hash = _read_admin_hash(root_env_file, os.path.getmtime(root_env_file))
             except Exception as e:
                 import logging
                 logger = logging.getLogger(__name__)
-                logger.warning(f"Error reading root .env file: {e}")
-        
-        # Fall back to environment variable or default
-        self.ADMIN_PASSWORD_HASH = os.environ.get('ADMIN_PASSWORD_HASH', admin_password_hash)
+                logger.warning("Error reading root .env file: %s", e)
         
-        # If still no hash, generate one for 'admin123'
-        if not self.ADMIN_PASSWORD_HASH:
-            from werkzeug.security import generate_password_hash
-            self.ADMIN_PASSWORD_HASH = generate_password_hash('admin123')
+        # If still no hash, admin login falls back to default_admin_password_hash()
+        self.ADMIN_PASSWORD_HASH = admin_password_hash or None
     
     def log_paths_if_debug(self, debug_paths: bool = False) -> None:
         """Log calculated paths if debug flag is enabled."""
@@ -94,15 +148,15 @@ class Config:
             import logging
             logger = logging.getLogger(__name__)
             logger.info("--- PATH DEBUGGING ENABLED ---")
-            logger.info(f"DEBUG: SCRIPT_DIR (backend location): {self.SCRIPT_DIR}")
-            logger.info(f"DEBUG: Calculated PROJECT_ROOT: {self.PROJECT_ROOT}")
-            logger.info(f"DEBUG: Calculated FRONTEND_DIR: {self.FRONTEND_DIR}")
-            logger.info(f"DEBUG: Calculated STATIC_DIR: {self.STATIC_DIR}")
-            logger.info(f"DEBUG: Calculated TEMPLATE_DIR: {self.TEMPLATE_DIR}")
+            logger.info("DEBUG: SCRIPT_DIR (backend location): %s", self.SCRIPT_DIR)
+            logger.info("DEBUG: Calculated PROJECT_ROOT: %s", self.PROJECT_ROOT)
+            logger.info("DEBUG: Calculated FRONTEND_DIR: %s", self.FRONTEND_DIR)
+            logger.info("DEBUG: Calculated STATIC_DIR: %s", self.STATIC_DIR)
+            logger.info("DEBUG: Calculated TEMPLATE_DIR: %s", self.TEMPLATE_DIR)
             
             image_path = os.path.join(self.STATIC_DIR, 'images', 'icon-192x192.png')
-            logger.info(f"DEBUG: Expected image path: {image_path}")
-            logger.info(f"DEBUG: Image file exists: {os.path.exists(image_path)}")
+            logger.info("DEBUG: Expected image path: %s", image_path)
+            logger.info("DEBUG: Image file exists: %s", os.path.exists(image_path))
             logger.info("--- END PATH DEBUGGING ---")
 
 
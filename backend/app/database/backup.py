@@ -9,17 +9,46 @@ import json
 import shutil
 import sqlite3
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_bytes(data: Any, indent: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON, with orjson when it is installed.
+    
+    Values JSON can't represent (such as datetimes) are written as strings.
+    
+    Args:
+        data: Data to encode
+        indent: Whether to indent the output by two spaces
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, default=str, indent=2 if indent else None).encode('utf-8')
+
+
+# Decoder for backup metadata files (orjson.JSONDecodeError subclasses json's)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
 class DatabaseBackup:
     """
     Handles database backup and restore operations.
     """
     
+    __slots__ = ('db_path', 'backup_dir')
+    
     def __init__(self, db_path: str, backup_dir: str):
         """
         Initialize DatabaseBackup.
@@ -52,10 +81,10 @@ class DatabaseBackup:
         try:
             # Copy entire JSON data directory
             shutil.copytree(json_data_dir, backup_path)
-            logger.info(f"JSON data backed up to: {backup_path}")
+            logger.info("JSON data backed up to: %s", backup_path)
             return backup_path
         except Exception as e:
-            logger.error(f"Failed to backup JSON data: {str(e)}")
+            logger.error("Failed to backup JSON data: %s", e)
             raise
     
     def backup_database(self, description: str = "Manual backup") -> str:
@@ -71,19 +100,28 @@ class DatabaseBackup:
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep back-to-back backups (e.g. the pre-restore backup
+        # right after a manual one) from colliding; VACUUM INTO refuses to
+        # overwrite an existing file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_filename = f"poker_db_backup_{timestamp}.db"
         backup_path = os.path.join(self.backup_dir, backup_filename)
         
         try:
-            # Create a backup using SQLite's backup API
             source_conn = sqlite3.connect(self.db_path)
-            backup_conn = sqlite3.connect(backup_path)
-            
-            source_conn.backup(backup_conn)
-            
-            source_conn.close()
-            backup_conn.close()
+            try:
+                if sqlite3.sqlite_version_info >= (3, 27, 0):
+                    # Write a compacted copy in one statement inside SQLite
+                    source_conn.execute("VACUUM INTO ?", (backup_path,))
+                else:
+                    # Older SQLite: copy page by page with the backup API
+                    backup_conn = sqlite3.connect(backup_path)
+                    try:
+                        source_conn.backup(backup_conn)
+                    finally:
+                        backup_conn.close()
+            finally:
+                source_conn.close()
             
             # Create metadata file
             metadata = {
@@ -94,14 +132,14 @@ class DatabaseBackup:
             }
             
             metadata_path = os.path.join(self.backup_dir, f"backup_metadata_{timestamp}.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with open(metadata_path, 'wb') as f:
+                f.write(_json_bytes(metadata, indent=True))
             
-            logger.info(f"Database backed up to: {backup_path}")
+            logger.info("Database backed up to: %s", backup_path)
             return backup_path
             
         except Exception as e:
-            logger.error(f"Failed to backup database: {str(e)}")
+            logger.error("Failed to backup database: %s", e)
             raise
     
     def list_backups(self) -> List[Dict[str, Any]]:
@@ -111,33 +149,46 @@ class DatabaseBackup:
         Returns:
             List of backup information dictionaries
         """
+        return [metadata for metadata, _ in self._scan_backups()]
+    
+    def _scan_backups(self) -> List[Tuple[Dict[str, Any], str]]:
+        """
+        Read the metadata of every backup in the backup directory.
+        
+        Returns:
+            List of (backup information, metadata file name) tuples, newest first
+        """
         backups = []
         
-        if not os.path.exists(self.backup_dir):
+        # One directory scan; the entries answer "does the backup file
+        # exist" without a stat() per backup
+        try:
+            with os.scandir(self.backup_dir) as it:
+                dir_entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
             return backups
         
-        for filename in os.listdir(self.backup_dir):
+        for filename, dir_entry in dir_entries.items():
             if filename.startswith("backup_metadata_") and filename.endswith(".json"):
-                metadata_path = os.path.join(self.backup_dir, filename)
                 try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
+                    with open(dir_entry.path, 'rb') as f:
+                        metadata = _json_loads(f.read())
                         
                     # Check if backup file still exists
-                    backup_file_path = os.path.join(self.backup_dir, metadata['backup_file'])
-                    if os.path.exists(backup_file_path):
-                        metadata['backup_size'] = os.path.getsize(backup_file_path)
+                    backup_entry = dir_entries.get(metadata['backup_file'])
+                    if backup_entry is not None:
+                        metadata['backup_size'] = backup_entry.stat().st_size
                         metadata['backup_exists'] = True
                     else:
                         metadata['backup_exists'] = False
                     
-                    backups.append(metadata)
+                    backups.append((metadata, filename))
                     
                 except Exception as e:
-                    logger.warning(f"Could not read backup metadata from {filename}: {str(e)}")
+                    logger.warning("Could not read backup metadata from %s: %s", filename, e)
         
         # Sort by backup date, newest first
-        backups.sort(key=lambda x: x.get('backup_date', ''), reverse=True)
+        backups.sort(key=lambda x: x[0].get('backup_date', ''), reverse=True)
         return backups
     
     def restore_database(self, backup_filename: str) -> bool:
@@ -153,23 +204,32 @@ class DatabaseBackup:
         backup_path = os.path.join(self.backup_dir, backup_filename)
         
         if not os.path.exists(backup_path):
-            logger.error(f"Backup file not found: {backup_path}")
+            logger.error("Backup file not found: %s", backup_path)
             return False
         
         try:
             # Create a backup of current database before restoring
             if os.path.exists(self.db_path):
                 current_backup = self.backup_database("Pre-restore backup")
-                logger.info(f"Current database backed up to: {current_backup}")
+                logger.info("Current database backed up to: %s", current_backup)
             
-            # Copy backup file to database location
-            shutil.copy2(backup_path, self.db_path)
+            # Copy the backup in through SQLite rather than over the file,
+            # so any WAL/shared-memory files of the live database stay consistent
+            source_conn = sqlite3.connect(backup_path)
+            try:
+                target_conn = sqlite3.connect(self.db_path)
+                try:
+                    source_conn.backup(target_conn)
+                finally:
+                    target_conn.close()
+            finally:
+                source_conn.close()
             
-            logger.info(f"Database restored from: {backup_path}")
+            logger.info("Database restored from: %s", backup_path)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to restore database: {str(e)}")
+            logger.error("Failed to restore database: %s", e)
             return False
     
     def export_data_to_json(self, output_dir: str) -> Dict[str, str]:
@@ -188,7 +248,6 @@ class DatabaseBackup:
             raise FileNotFoundError(f"Database file not found: {self.db_path}")
         
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
         
         output_files = {}
         
@@ -196,24 +255,29 @@ class DatabaseBackup:
             tables = ['players', 'sessions', 'entries']
             
             for table in tables:
-                cursor = conn.execute(f"SELECT * FROM {table}")
-                rows = cursor.fetchall()
-                
-                # Convert rows to dictionaries
-                data = [dict(row) for row in rows]
-                
-                # Write to JSON file
+                # Stream rows from the cursor straight into the file, one JSON
+                # object per line, so a large table is never held in memory
                 output_file = os.path.join(output_dir, f"{table}.json")
-                with open(output_file, 'w') as f:
-                    json.dump(data, f, indent=2, default=str)  # default=str handles datetime
+                count = 0
+                cursor = conn.execute(f"SELECT * FROM {table}")
+                # Plain tuple rows zipped with the column names once per
+                # table are cheaper than sqlite3.Row objects
+                columns = [description[0] for description in cursor.description]
+                with open(output_file, 'wb') as f:
+                    f.write(b'[')
+                    for row in cursor:
+                        f.write(b',\n  ' if count else b'\n  ')
+                        f.write(_json_bytes(dict(zip(columns, row))))
+                        count += 1
+                    f.write(b'\n]')
                 
                 output_files[table] = output_file
-                logger.info(f"Exported {len(data)} records from {table} to {output_file}")
+                logger.info("Exported %s records from %s to %s", count, table, output_file)
             
             return output_files
             
         except Exception as e:
-            logger.error(f"Failed to export data to JSON: {str(e)}")
+            logger.error("Failed to export data to JSON: %s", e)
             raise
         finally:
             conn.close()
@@ -228,7 +292,7 @@ class DatabaseBackup:
         Returns:
             Number of backups removed
         """
-        backups = self.list_backups()
+        backups = self._scan_backups()
         
         if len(backups) <= keep_count:
             return 0
@@ -236,23 +300,19 @@ class DatabaseBackup:
         backups_to_remove = backups[keep_count:]
         removed_count = 0
         
-        for backup in backups_to_remove:
+        for backup, metadata_filename in backups_to_remove:
             try:
-                # Remove backup file
-                backup_file_path = os.path.join(self.backup_dir, backup['backup_file'])
-                if os.path.exists(backup_file_path):
-                    os.remove(backup_file_path)
+                # Remove backup file (already gone if backup_exists is False)
+                if backup['backup_exists']:
+                    os.remove(os.path.join(self.backup_dir, backup['backup_file']))
                 
-                # Remove metadata file (extract timestamp from backup_file)
-                timestamp = backup['backup_file'].replace('poker_db_backup_', '').replace('.db', '')
-                metadata_file = os.path.join(self.backup_dir, f"backup_metadata_{timestamp}.json")
-                if os.path.exists(metadata_file):
-                    os.remove(metadata_file)
+                # Remove the metadata file the backup was listed from
+                os.remove(os.path.join(self.backup_dir, metadata_filename))
                 
                 removed_count += 1
-                logger.info(f"Removed old backup: {backup['backup_file']}")
+                logger.info("Removed old backup: %s", backup['backup_file'])
                 
             except Exception as e:
-                logger.warning(f"Failed to remove backup {backup['backup_file']}: {str(e)}")
+                logger.warning("Failed to remove backup %s: %s", backup['backup_file'], e)
         
         return removed_count
\ No newline at end of file
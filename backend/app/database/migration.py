@@ -7,15 +7,24 @@ This module handles migration from JSON files to SQLite database.
 import os
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from typing import Dict, Any, List, Optional, Set, Tuple
 from flask import Flask
 from sqlalchemy.exc import IntegrityError
 
 from .models import db, Player, Session, Entry
 from .backup import DatabaseBackup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Decoder for the JSON data files (orjson.JSONDecodeError subclasses json's)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class DataMigration:
     """
@@ -34,6 +43,10 @@ class DataMigration:
         self.json_data_dir = json_data_dir
         self.backup_handler = None
         
+        # Parsed JSON files by name, so validation, migration and
+        # verification don't each parse the same files again
+        self._json_cache: Dict[str, List[Dict[str, Any]]] = {}
+        
         # Set up backup handler if database exists
         db_path = app.config.get('SQLALCHEMY_DATABASE_URI', '').replace('sqlite:///', '')
         if db_path:
@@ -44,29 +57,47 @@ class DataMigration:
         """
         Load data from a JSON file.
         
+        Each file is parsed once and the result reused until migrate_data
+        starts a new run.
+        
         Args:
             filename: Name of the JSON file to load
             
+        Returns:
+            List of dictionaries containing the data
+        """
+        data = self._json_cache.get(filename)
+        if data is None:
+            data = self._json_cache[filename] = self._read_json_file(filename)
+        return data
+    
+    def _read_json_file(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Read and parse a JSON file from the data directory.
+        
+        Args:
+            filename: Name of the JSON file to read
+            
         Returns:
             List of dictionaries containing the data
         """
         file_path = os.path.join(self.json_data_dir, filename)
         
         if not os.path.exists(file_path):
-            logger.warning(f"JSON file not found: {file_path}")
+            logger.warning("JSON file not found: %s", file_path)
             return []
         
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb') as f:
                 content = f.read()
                 if not content.strip():
                     return []
-                return json.loads(content)
+                return _json_loads(content)
         except json.JSONDecodeError as e:
-            logger.error(f"Could not decode JSON from {file_path}: {str(e)}")
+            logger.error("Could not decode JSON from %s: %s", file_path, e)
             return []
         except Exception as e:
-            logger.error(f"Error reading {file_path}: {str(e)}")
+            logger.error("Error reading %s: %s", file_path, e)
             return []
     
     def validate_json_data(self) -> Dict[str, Any]:
@@ -84,29 +115,25 @@ class DataMigration:
         }
         
         # Load and validate each file
-        files_to_check = ['players.json', 'sessions.json', 'entries.json']
+        players_data = self._load_json_file('players.json')
+        sessions_data = self._load_json_file('sessions.json')
+        entries_data = self._load_json_file('entries.json')
         
-        for filename in files_to_check:
-            table_name = filename.replace('.json', '')
-            data = self._load_json_file(filename)
-            validation_results['counts'][table_name] = len(data)
-            
-            if filename == 'players.json':
-                self._validate_players_data(data, validation_results)
-            elif filename == 'sessions.json':
-                self._validate_sessions_data(data, validation_results)
-            elif filename == 'entries.json':
-                self._validate_entries_data(data, validation_results)
+        validation_results['counts']['players'] = len(players_data)
+        validation_results['counts']['sessions'] = len(sessions_data)
+        validation_results['counts']['entries'] = len(entries_data)
+        
+        player_ids = self._validate_players_data(players_data, validation_results)
+        session_ids = self._validate_sessions_data(sessions_data, validation_results)
+        self._validate_entries_data(entries_data, validation_results)
         
-        # Cross-reference validation
-        self._validate_cross_references(validation_results)
+        # Cross-reference validation against the IDs collected above
+        self._validate_cross_references(entries_data, player_ids, session_ids, validation_results)
         
         return validation_results
     
-    def _validate_players_data(self, players_data: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
-        """Validate players data structure."""
-        player_ids = set()
-        
+    def _validate_players_data(self, players_data: List[Dict[str, Any]], results: Dict[str, Any]) -> Set[Any]:
+        """Validate players data structure and return the player IDs found."""
         for i, player in enumerate(players_data):
             if not isinstance(player, dict):
                 results['errors'].append(f"Player at index {i} is not a dictionary")
@@ -120,21 +147,14 @@ class DataMigration:
                     results['errors'].append(f"Player at index {i} missing required field: {field}")
                     results['valid'] = False
             
-            # Check for duplicate player_ids
-            player_id = player.get('player_id')
-            if player_id in player_ids:
-                results['errors'].append(f"Duplicate player_id found: {player_id}")
-                results['valid'] = False
-            player_ids.add(player_id)
-            
             # Validate data types
             if 'seven_two_wins' in player and not isinstance(player['seven_two_wins'], int):
-                results['warnings'].append(f"Player {player_id} has non-integer seven_two_wins")
-    
-    def _validate_sessions_data(self, sessions_data: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
-        """Validate sessions data structure."""
-        session_ids = set()
+                results['warnings'].append(f"Player {player.get('player_id')} has non-integer seven_two_wins")
         
+        return self._check_duplicate_ids(players_data, 'player_id', results)
+    
+    def _validate_sessions_data(self, sessions_data: List[Dict[str, Any]], results: Dict[str, Any]) -> Set[Any]:
+        """Validate sessions data structure and return the session IDs found."""
         for i, session in enumerate(sessions_data):
             if not isinstance(session, dict):
                 results['errors'].append(f"Session at index {i} is not a dictionary")
@@ -148,13 +168,6 @@ class DataMigration:
                     results['errors'].append(f"Session at index {i} missing required field: {field}")
                     results['valid'] = False
             
-            # Check for duplicate session_ids
-            session_id = session.get('session_id')
-            if session_id in session_ids:
-                results['errors'].append(f"Duplicate session_id found: {session_id}")
-                results['valid'] = False
-            session_ids.add(session_id)
-            
             # Validate date format
             date_str = session.get('date')
             if date_str:
@@ -162,13 +175,13 @@ class DataMigration:
                     from datetime import datetime
                     datetime.strptime(date_str, "%Y-%m-%d")
                 except ValueError:
-                    results['errors'].append(f"Session {session_id} has invalid date format: {date_str}")
+                    results['errors'].append(f"Session {session.get('session_id')} has invalid date format: {date_str}")
                     results['valid'] = False
+        
+        return self._check_duplicate_ids(sessions_data, 'session_id', results)
     
     def _validate_entries_data(self, entries_data: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
         """Validate entries data structure."""
-        entry_ids = set()
-        
         for i, entry in enumerate(entries_data):
             if not isinstance(entry, dict):
                 results['errors'].append(f"Entry at index {i} is not a dictionary")
@@ -181,27 +194,25 @@ class DataMigration:
                 if field not in entry:
                     results['errors'].append(f"Entry at index {i} missing required field: {field}")
                     results['valid'] = False
-            
-            # Check for duplicate entry_ids
-            entry_id = entry.get('entry_id')
-            if entry_id in entry_ids:
-                results['errors'].append(f"Duplicate entry_id found: {entry_id}")
+        
+        self._check_duplicate_ids(entries_data, 'entry_id', results)
+    
+    def _check_duplicate_ids(self, rows: List[Dict[str, Any]], id_field: str, results: Dict[str, Any]) -> Set[Any]:
+        """Report every ID that appears on more than one row and return the set of IDs seen."""
+        id_counts = Counter(row[id_field] for row in rows if isinstance(row, dict) and id_field in row)
+        for row_id, count in id_counts.items():
+            if count > 1:
+                results['errors'].append(f"Duplicate {id_field} found: {row_id}")
                 results['valid'] = False
-            entry_ids.add(entry_id)
+        return set(id_counts)
     
-    def _validate_cross_references(self, results: Dict[str, Any]) -> None:
-        """Validate cross-references between tables."""
-        # Load all data for cross-validation
-        players_data = self._load_json_file('players.json')
-        sessions_data = self._load_json_file('sessions.json')
-        entries_data = self._load_json_file('entries.json')
-        
-        # Create sets of existing IDs
-        player_ids = {p['player_id'] for p in players_data if 'player_id' in p}
-        session_ids = {s['session_id'] for s in sessions_data if 'session_id' in s}
-        
-        # Check if entries reference valid players and sessions
+    def _validate_cross_references(self, entries_data: List[Dict[str, Any]], player_ids: Set[Any],
+                                   session_ids: Set[Any], results: Dict[str, Any]) -> None:
+        """Validate that entries reference known players and sessions."""
         for entry in entries_data:
+            if not isinstance(entry, dict):
+                continue
+            
             if 'player_id' in entry and entry['player_id'] not in player_ids:
                 results['errors'].append(f"Entry {entry.get('entry_id')} references non-existent player: {entry['player_id']}")
                 results['valid'] = False
@@ -229,6 +240,9 @@ class DataMigration:
             'warnings': []
         }
         
+        # Re-read the JSON files in case they changed since the last run
+        self._json_cache.clear()
+        
         with self.app.app_context():
             try:
                 # Validate JSON data first
@@ -258,24 +272,33 @@ class DataMigration:
                 # Create database tables
                 db.create_all()
                 
+                # The _migrate_* methods only add rows; all three tables are
+                # committed together below, so a failure rolls back everything.
+                # The player and session ID sets are loaded once and grow as
+                # rows are migrated, so entries can check references without
+                # querying both tables again.
+                player_ids = {row[0] for row in db.session.query(Player.player_id)}
+                session_ids = {row[0] for row in db.session.query(Session.session_id)}
+                
                 # Migrate players first (no foreign key dependencies)
-                players_count = self._migrate_players()
+                players_count = self._migrate_players(player_ids)
                 migration_results['migrated_counts']['players'] = players_count
                 
                 # Migrate sessions (no foreign key dependencies)
-                sessions_count = self._migrate_sessions()
+                sessions_count = self._migrate_sessions(session_ids)
                 migration_results['migrated_counts']['sessions'] = sessions_count
                 
                 # Migrate entries (depends on players and sessions)
-                entries_count = self._migrate_entries()
+                entries_count = self._migrate_entries(player_ids, session_ids)
                 migration_results['migrated_counts']['entries'] = entries_count
                 
+                db.session.commit()
                 migration_results['success'] = True
-                logger.info(f"Migration completed successfully: {migration_results['migrated_counts']}")
+                logger.info("Migration completed successfully: %s", migration_results['migrated_counts'])
                 
             except Exception as e:
                 migration_results['errors'].append(f"Migration failed: {str(e)}")
-                logger.error(f"Migration failed: {str(e)}")
+                logger.error("Migration failed: %s", e)
                 
                 # Rollback if possible
                 try:
@@ -285,112 +308,129 @@ class DataMigration:
         
         return migration_results
     
-    def _migrate_players(self) -> int:
+    def _migrate_players(self, existing_ids: Set[str]) -> int:
         """
         Migrate players data.
         
+        Args:
+            existing_ids: Player IDs already in the database; migrated IDs are added to it
+            
         Returns:
             Number of players migrated
         """
         players_data = self._load_json_file('players.json')
-        migrated_count = 0
+        players = []
+        skipped = 0
         
         for player_data in players_data:
             try:
                 # Check if player already exists
-                existing_player = Player.query.filter_by(player_id=player_data['player_id']).first()
-                if existing_player:
-                    logger.warning(f"Player {player_data['player_id']} already exists, skipping")
+                if player_data['player_id'] in existing_ids:
+                    skipped += 1
                     continue
                 
-                player = Player.from_dict(player_data)
-                db.session.add(player)
-                migrated_count += 1
+                players.append(Player.from_dict(player_data))
+                existing_ids.add(player_data['player_id'])
                 
             except Exception as e:
-                logger.error(f"Failed to migrate player {player_data.get('player_id', 'unknown')}: {str(e)}")
+                logger.error("Failed to migrate player %s: %s", player_data.get('player_id', 'unknown'), e)
                 raise
         
-        db.session.commit()
-        logger.info(f"Migrated {migrated_count} players")
-        return migrated_count
+        if skipped:
+            logger.warning("Skipped %s players that already exist", skipped)
+        
+        # Insert in batched statements instead of one unit-of-work add per row
+        db.session.bulk_save_objects(players)
+        logger.info("Migrated %s players", len(players))
+        return len(players)
     
-    def _migrate_sessions(self) -> int:
+    def _migrate_sessions(self, existing_ids: Set[str]) -> int:
         """
         Migrate sessions data.
         
+        Args:
+            existing_ids: Session IDs already in the database; migrated IDs are added to it
+            
         Returns:
             Number of sessions migrated
         """
         sessions_data = self._load_json_file('sessions.json')
-        migrated_count = 0
+        sessions = []
+        skipped = 0
         
         for session_data in sessions_data:
             try:
                 # Check if session already exists
-                existing_session = Session.query.filter_by(session_id=session_data['session_id']).first()
-                if existing_session:
-                    logger.warning(f"Session {session_data['session_id']} already exists, skipping")
+                if session_data['session_id'] in existing_ids:
+                    skipped += 1
                     continue
                 
-                session = Session.from_dict(session_data)
-                db.session.add(session)
-                migrated_count += 1
+                sessions.append(Session.from_dict(session_data))
+                existing_ids.add(session_data['session_id'])
                 
             except Exception as e:
-                logger.error(f"Failed to migrate session {session_data.get('session_id', 'unknown')}: {str(e)}")
+                logger.error("Failed to migrate session %s: %s", session_data.get('session_id', 'unknown'), e)
                 raise
         
-        db.session.commit()
-        logger.info(f"Migrated {migrated_count} sessions")
-        return migrated_count
+        if skipped:
+            logger.warning("Skipped %s sessions that already exist", skipped)
+        
+        db.session.bulk_save_objects(sessions)
+        logger.info("Migrated %s sessions", len(sessions))
+        return len(sessions)
     
-    def _migrate_entries(self) -> int:
+    def _migrate_entries(self, player_ids: Set[str], session_ids: Set[str]) -> int:
         """
         Migrate entries data.
         
+        Args:
+            player_ids: Player IDs in the database, including those just migrated
+            session_ids: Session IDs in the database, including those just migrated
+            
         Returns:
             Number of entries migrated
         """
         entries_data = self._load_json_file('entries.json')
-        migrated_count = 0
+        existing_ids = {row[0] for row in db.session.query(Entry.entry_id)}
+        entries = []
+        skipped = 0
         
         for entry_data in entries_data:
             try:
                 # Check if entry already exists
-                existing_entry = Entry.query.filter_by(entry_id=entry_data['entry_id']).first()
-                if existing_entry:
-                    logger.warning(f"Entry {entry_data['entry_id']} already exists, skipping")
+                if entry_data['entry_id'] in existing_ids:
+                    skipped += 1
                     continue
                 
                 # Verify that referenced player and session exist
-                player = Player.query.filter_by(player_id=entry_data['player_id']).first()
-                session = Session.query.filter_by(session_id=entry_data['session_id']).first()
-                
-                if not player:
-                    logger.error(f"Cannot migrate entry {entry_data['entry_id']}: player {entry_data['player_id']} not found")
+                if entry_data['player_id'] not in player_ids:
+                    logger.error("Cannot migrate entry %s: player %s not found", entry_data['entry_id'], entry_data['player_id'])
                     continue
                 
-                if not session:
-                    logger.error(f"Cannot migrate entry {entry_data['entry_id']}: session {entry_data['session_id']} not found")
+                if entry_data['session_id'] not in session_ids:
+                    logger.error("Cannot migrate entry %s: session %s not found", entry_data['entry_id'], entry_data['session_id'])
                     continue
                 
-                entry = Entry.from_dict(entry_data)
-                db.session.add(entry)
-                migrated_count += 1
+                entries.append(Entry.from_dict(entry_data))
                 
             except Exception as e:
-                logger.error(f"Failed to migrate entry {entry_data.get('entry_id', 'unknown')}: {str(e)}")
+                logger.error("Failed to migrate entry %s: %s", entry_data.get('entry_id', 'unknown'), e)
                 raise
         
-        db.session.commit()
-        logger.info(f"Migrated {migrated_count} entries")
-        return migrated_count
+        if skipped:
+            logger.warning("Skipped %s entries that already exist", skipped)
+        
+        db.session.bulk_save_objects(entries)
+        logger.info("Migrated %s entries", len(entries))
+        return len(entries)
     
-    def verify_migration(self) -> Dict[str, Any]:
+    def verify_migration(self, full: bool = True) -> Dict[str, Any]:
         """
         Verify that migration was successful by comparing counts and data integrity.
         
+        Args:
+            full: Also run the data integrity queries; pass False to only compare counts
+            
         Returns:
             Dictionary with verification results
         """
@@ -409,10 +449,15 @@ class DataMigration:
                 verification_results['json_counts']['sessions'] = len(self._load_json_file('sessions.json'))
                 verification_results['json_counts']['entries'] = len(self._load_json_file('entries.json'))
                 
-                # Get database counts
-                verification_results['db_counts']['players'] = Player.query.count()
-                verification_results['db_counts']['sessions'] = Session.query.count()
-                verification_results['db_counts']['entries'] = Entry.query.count()
+                # Get database counts in a single query
+                player_count, session_count, entry_count = db.session.query(
+                    db.session.query(db.func.count(Player.id)).scalar_subquery(),
+                    db.session.query(db.func.count(Session.id)).scalar_subquery(),
+                    db.session.query(db.func.count(Entry.id)).scalar_subquery()
+                ).one()
+                verification_results['db_counts']['players'] = player_count
+                verification_results['db_counts']['sessions'] = session_count
+                verification_results['db_counts']['entries'] = entry_count
                 
                 # Compare counts
                 for table in ['players', 'sessions', 'entries']:
@@ -425,7 +470,8 @@ class DataMigration:
                         verification_results['success'] = False
                 
                 # Data integrity checks
-                self._verify_data_integrity(verification_results)
+                if full:
+                    self._verify_data_integrity(verification_results)
                 
             except Exception as e:
                 verification_results['errors'].append(f"Verification failed: {str(e)}")
@@ -437,10 +483,14 @@ class DataMigration:
         """Perform data integrity checks."""
         checks = []
         
-        # Check that all entries have valid player and session references
-        orphaned_entries = db.session.query(Entry).outerjoin(Player).outerjoin(Session).filter(
-            (Player.id.is_(None)) | (Session.id.is_(None))
-        ).count()
+        # Check that all entries have valid player and session references. Each
+        # entry is probed against the unique player_id/session_id indexes
+        # rather than joining the three tables.
+        player_exists = db.session.query(Player.id).filter(Player.player_id == Entry.player_id).exists()
+        session_exists = db.session.query(Session.id).filter(Session.session_id == Entry.session_id).exists()
+        orphaned_entries = db.session.query(db.func.count(Entry.id)).filter(
+            ~player_exists | ~session_exists
+        ).scalar()
         
         if orphaned_entries > 0:
             results['errors'].append(f"Found {orphaned_entries} entries with invalid references")
@@ -7,10 +7,11 @@ missing columns and applying necessary changes during application startup.
 
 import logging
 import sqlite3
-from typing import List, Dict, Any
+from contextlib import closing
+from typing import List, Dict, Any, Set
 from flask import Flask
 
-from .models import db
+from .models import db, set_sqlite_pragmas, _json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -19,187 +20,230 @@ class AutoMigration:
     """Handles automatic database migrations."""
     
     @staticmethod
-    def get_table_columns(db_path: str, table_name: str) -> List[str]:
+    def _connect(db_path: str) -> sqlite3.Connection:
         """
-        Get column names for a specific table.
+        Open a SQLite connection set up like the app's own connections.
+        
+        Without this, raw sqlite3 connections run with synchronous=FULL and
+        fsync on every commit.
         
         Args:
             db_path: Path to SQLite database
+            
+        Returns:
+            Connection using WAL journaling and synchronous=NORMAL
+        """
+        conn = sqlite3.connect(db_path)
+        set_sqlite_pragmas(conn, None)
+        return conn
+    
+    @staticmethod
+    def get_table_columns(conn: sqlite3.Connection, table_name: str) -> List[str]:
+        """
+        Get column names for a specific table.
+        
+        Args:
+            conn: Open SQLite connection
             table_name: Name of the table
             
         Returns:
             List of column names
         """
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [column[1] for column in cursor.fetchall()]
-            conn.close()
-            return columns
+            cursor = conn.execute(f"PRAGMA table_info({table_name})")
+            return [column[1] for column in cursor.fetchall()]
         except sqlite3.Error as e:
-            logger.error(f"Error reading table columns: {e}")
+            logger.error("Error reading table columns: %s", e)
             return []
     
     @staticmethod
-    def add_is_cashed_out_column(db_path: str) -> bool:
+    def _introspect_schema(conn: sqlite3.Connection) -> Dict[str, Set[str]]:
+        """
+        Read every table and its columns in one query.
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            Dictionary mapping table name to its set of column names
+        """
+        schema: Dict[str, Set[str]] = {}
+        cursor = conn.execute("""
+            SELECT m.name, p.name
+            FROM sqlite_master AS m
+            JOIN pragma_table_info(m.name) AS p
+            WHERE m.type = 'table'
+        """)
+        for table_name, column_name in cursor:
+            schema.setdefault(table_name, set()).add(column_name)
+        return schema
+    
+    @staticmethod
+    def add_is_cashed_out_column(conn: sqlite3.Connection, entry_columns: Set[str]) -> bool:
         """
         Add is_cashed_out column to entries table if missing.
         
         Args:
-            db_path: Path to SQLite database
+            conn: Open SQLite connection
+            entry_columns: Current column names of the entries table
             
         Returns:
             True if migration was needed and successful, False if column already exists
         """
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Check if column already exists
-            cursor.execute("PRAGMA table_info(entries)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'is_cashed_out' in columns:
-                logger.info("Column 'is_cashed_out' already exists")
-                conn.close()
-                return False
-            
-            logger.info("Adding 'is_cashed_out' column to entries table...")
-            
-            # Add the new column with default value False
-            cursor.execute("""
-                ALTER TABLE entries 
-                ADD COLUMN is_cashed_out BOOLEAN NOT NULL DEFAULT 0
-            """)
-            
-            # Update existing entries: set is_cashed_out to True where payout > 0
-            cursor.execute("""
-                UPDATE entries 
-                SET is_cashed_out = 1 
-                WHERE payout > 0
-            """)
-            
-            conn.commit()
-            affected_rows = cursor.rowcount
-            logger.info(f"Successfully added 'is_cashed_out' column. Updated {affected_rows} existing entries.")
-            conn.close()
-            return True
-            
-        except sqlite3.Error as e:
-            logger.error(f"Error adding is_cashed_out column: {e}")
-            if conn:
-                conn.close()
+        if 'is_cashed_out' in entry_columns:
+            logger.info("Column 'is_cashed_out' already exists")
             return False
+        
+        cursor = conn.cursor()
+        
+        logger.info("Adding 'is_cashed_out' column to entries table...")
+        
+        # Add the new column with default value False
+        cursor.execute("""
+            ALTER TABLE entries 
+            ADD COLUMN is_cashed_out BOOLEAN NOT NULL DEFAULT 0
+        """)
+        
+        # Update existing entries: set is_cashed_out to True where payout > 0
+        cursor.execute("""
+            UPDATE entries 
+            SET is_cashed_out = 1 
+            WHERE payout > 0
+        """)
+        
+        affected_rows = cursor.rowcount
+        logger.info("Successfully added 'is_cashed_out' column. Updated %s existing entries.", affected_rows)
+        return True
     
     @staticmethod
-    def add_session_strikes_column(db_path: str) -> bool:
+    def add_session_strikes_column(conn: sqlite3.Connection, entry_columns: Set[str]) -> bool:
         """
         Add session_strikes column to entries table if missing.
         
         Args:
-            db_path: Path to SQLite database
+            conn: Open SQLite connection
+            entry_columns: Current column names of the entries table
             
         Returns:
             True if migration was needed and successful, False if column already exists
         """
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Check if column already exists
-            cursor.execute("PRAGMA table_info(entries)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'session_strikes' in columns:
-                logger.info("Column 'session_strikes' already exists")
-                conn.close()
-                return False
-            
-            logger.info("Adding 'session_strikes' column to entries table...")
-            
-            # Add the new column with default value 0
-            cursor.execute("""
-                ALTER TABLE entries 
-                ADD COLUMN session_strikes INTEGER NOT NULL DEFAULT 0
-            """)
-            
-            conn.commit()
-            logger.info("Successfully added 'session_strikes' column.")
-            conn.close()
-            return True
-            
-        except sqlite3.Error as e:
-            logger.error(f"Error adding session_strikes column: {e}")
-            if conn:
-                conn.close()
+        if 'session_strikes' in entry_columns:
+            logger.info("Column 'session_strikes' already exists")
             return False
+        
+        logger.info("Adding 'session_strikes' column to entries table...")
+        
+        # Add the new column with default value 0
+        conn.execute("""
+            ALTER TABLE entries 
+            ADD COLUMN session_strikes INTEGER NOT NULL DEFAULT 0
+        """)
+        
+        logger.info("Successfully added 'session_strikes' column.")
+        return True
     
     @staticmethod
-    def create_calendar_tables(db_path: str) -> bool:
+    def create_calendar_tables(conn: sqlite3.Connection, table_names: Set[str]) -> bool:
         """
         Create calendar_events and event_rsvps tables if they don't exist.
 
         Args:
-            db_path: Path to SQLite database
+            conn: Open SQLite connection
+            table_names: Names of the tables already in the database
 
         Returns:
             True if migration was needed and successful, False if tables already exist
         """
-        try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            # Check if table already exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='calendar_events'")
-            if cursor.fetchone():
-                logger.info("Table 'calendar_events' already exists")
-                conn.close()
-                return False
-
-            logger.info("Creating calendar_events and event_rsvps tables...")
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS calendar_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id VARCHAR(30) UNIQUE NOT NULL,
-                    title VARCHAR(200) NOT NULL DEFAULT 'Poker Night',
-                    date VARCHAR(10) NOT NULL,
-                    time VARCHAR(5),
-                    location VARCHAR(200),
-                    description TEXT,
-                    default_buy_in_value FLOAT NOT NULL DEFAULT 20.00,
-                    max_players INTEGER,
-                    session_id VARCHAR(30) REFERENCES sessions(session_id),
-                    is_cancelled BOOLEAN NOT NULL DEFAULT 0,
-                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS event_rsvps (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id VARCHAR(30) NOT NULL REFERENCES calendar_events(event_id),
-                    player_id VARCHAR(20) NOT NULL REFERENCES players(player_id),
-                    status VARCHAR(10) NOT NULL,
-                    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(event_id, player_id)
-                )
-            """)
-
-            conn.commit()
-            logger.info("Successfully created calendar_events and event_rsvps tables.")
-            conn.close()
-            return True
-
-        except sqlite3.Error as e:
-            logger.error(f"Error creating calendar tables: {e}")
-            if conn:
-                conn.close()
+        if 'calendar_events' in table_names:
+            logger.info("Table 'calendar_events' already exists")
             return False
 
+        cursor = conn.cursor()
+
+        logger.info("Creating calendar_events and event_rsvps tables...")
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS calendar_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id VARCHAR(30) UNIQUE NOT NULL,
+                title VARCHAR(200) NOT NULL DEFAULT 'Poker Night',
+                date VARCHAR(10) NOT NULL,
+                time VARCHAR(5),
+                location VARCHAR(200),
+                description TEXT,
+                default_buy_in_value FLOAT NOT NULL DEFAULT 20.00,
+                max_players INTEGER,
+                session_id VARCHAR(30) REFERENCES sessions(session_id),
+                is_cancelled BOOLEAN NOT NULL DEFAULT 0,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS event_rsvps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id VARCHAR(30) NOT NULL REFERENCES calendar_events(event_id),
+                player_id VARCHAR(20) NOT NULL REFERENCES players(player_id),
+                status VARCHAR(10) NOT NULL,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(event_id, player_id)
+            )
+        """)
+
+        logger.info("Successfully created calendar_events and event_rsvps tables.")
+        return True
+
+    @staticmethod
+    def backfill_chip_distributions(conn: sqlite3.Connection) -> int:
+        """
+        Fill in chip_distribution and total_chips for sessions missing them.
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            Number of sessions updated
+        """
+        try:
+            from scripts.chip_calculator import cached_chip_data
+        except ImportError:
+            try:
+                from chip_calculator import cached_chip_data
+            except ImportError:
+                logger.warning("Could not import chip_calculator, skipping chip distribution backfill")
+                return 0
+        
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT session_id, default_buy_in_value
+            FROM sessions
+            WHERE chip_distribution IS NULL
+        """)
+        updates = []
+        for session_id, buy_in in cursor.fetchall():
+            chip_data = cached_chip_data(buy_in)
+            if chip_data:
+                updates.append((
+                    _json_dumps(chip_data['distribution']),
+                    chip_data['total'],
+                    session_id
+                ))
+        
+        if not updates:
+            return 0
+        
+        logger.info("Backfilling chip distribution for %s sessions...", len(updates))
+        cursor.executemany("""
+            UPDATE sessions
+            SET chip_distribution = ?, total_chips = ?
+            WHERE session_id = ?
+        """, updates)
+        
+        return len(updates)
+
     @staticmethod
     def run_auto_migrations(app: Flask) -> None:
         """
@@ -221,17 +265,40 @@ class AutoMigration:
         
         migrations_applied = []
         
-        # Run individual migrations
-        if AutoMigration.add_is_cashed_out_column(db_path):
-            migrations_applied.append("is_cashed_out column")
-        
-        if AutoMigration.add_session_strikes_column(db_path):
-            migrations_applied.append("session_strikes column")
+        # Run individual migrations on one connection, in one transaction.
+        # closing() releases the connection on any exit; the inner "with conn"
+        # commits on success and rolls back if an error escapes. BEGIN
+        # IMMEDIATE takes the write lock before the schema is read, so a
+        # second process starting up waits instead of migrating the same
+        # columns from a stale view. The helpers let sqlite3 errors propagate,
+        # so a failure in any of them rolls back every migration together.
+        try:
+            with closing(AutoMigration._connect(db_path)) as conn:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    schema = AutoMigration._introspect_schema(conn)
+                    entry_columns = schema.get('entries', set())
+                    
+                    if AutoMigration.add_is_cashed_out_column(conn, entry_columns):
+                        migrations_applied.append("is_cashed_out column")
+                    
+                    if AutoMigration.add_session_strikes_column(conn, entry_columns):
+                        migrations_applied.append("session_strikes column")
 
-        if AutoMigration.create_calendar_tables(db_path):
-            migrations_applied.append("calendar tables")
+                    if AutoMigration.create_calendar_tables(conn, set(schema)):
+                        migrations_applied.append("calendar tables")
+
+                    if AutoMigration.backfill_chip_distributions(conn):
+                        migrations_applied.append("chip distribution backfill")
+                
+                # Refresh planner statistics for anything the migrations changed;
+                # this is a no-op when nothing needs analyzing.
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.error("Error running auto-migrations: %s", e)
+            migrations_applied = []
 
         if migrations_applied:
-            logger.info(f"Auto-migrations completed: {', '.join(migrations_applied)}")
+            logger.info("Auto-migrations completed: %s", ', '.join(migrations_applied))
         else:
             logger.info("No migrations needed - database schema is up to date")
\ No newline at end of file
@@ -4,6 +4,7 @@ SQLAlchemy database models for Poker Night PWA.
 This module defines the database schema using SQLAlchemy ORM.
 """
 
+import json
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from decimal import Decimal, ROUND_HALF_UP
@@ -11,8 +12,43 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 db = SQLAlchemy()
 
+# Decoder for JSON stored in text columns (orjson.JSONDecodeError subclasses json's)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Quantization step for monetary values
+_CENT = Decimal('0.01')
+
+
+def _json_dumps(data: Any) -> str:
+    """Encode data for a JSON text column, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Configure a new SQLite connection for concurrent access.
+    
+    WAL journaling lets readers keep going while a write is in progress,
+    and synchronous=NORMAL is safe with WAL while avoiding an fsync per commit.
+    
+    Args:
+        dbapi_connection: Raw sqlite3 connection being opened
+        connection_record: SQLAlchemy pool record for the connection
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 def round_to_cents(value: Optional[float]) -> Optional[float]:
     """
@@ -27,10 +63,15 @@ def round_to_cents(value: Optional[float]) -> Optional[float]:
     if value is None:
         return None
     
+    # Stored amounts are already whole cents; those come back unchanged, so
+    # serializing them skips the Decimal round trip
+    if isinstance(value, float) and round(value, 2) == value:
+        return value
+    
     # Convert to Decimal for precise arithmetic
     decimal_value = Decimal(str(value))
     # Round to 2 decimal places (cents)
-    rounded = decimal_value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    rounded = decimal_value.quantize(_CENT, rounding=ROUND_HALF_UP)
     # Convert back to float
     return float(rounded)
 
@@ -134,10 +175,14 @@ class Session(db.Model):
     def __repr__(self) -> str:
         return f'<Session {self.session_id}: {self.date}>'
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, total_value: Optional[float] = None) -> Dict[str, Any]:
         """
         Convert Session instance to dictionary.
         
+        Args:
+            total_value: Precomputed sum of the session's buy-ins; when omitted
+                it is summed from the session's entries
+            
         Returns:
             Dictionary representation of session
         """
@@ -153,8 +198,10 @@ class Session(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
         
-        # Calculate total value from entries
-        if self.entries:
+        # Calculate total value from entries unless the caller already has it
+        if total_value is not None:
+            result['total_value'] = round_to_cents(total_value)
+        elif self.entries:
             total_value = sum(entry.total_buy_in_amount or 0 for entry in self.entries)
             result['total_value'] = round_to_cents(total_value)
         else:
@@ -162,9 +209,8 @@ class Session(db.Model):
         
         # Parse chip distribution if it exists
         if self.chip_distribution:
-            import json
             try:
-                result['chip_distribution'] = json.loads(self.chip_distribution)
+                result['chip_distribution'] = _json_loads(self.chip_distribution)
             except json.JSONDecodeError:
                 result['chip_distribution'] = {}
         
@@ -184,8 +230,6 @@ class Session(db.Model):
         Returns:
             Session instance
         """
-        import json
-        
         session = cls(
             session_id=data['session_id'],
             date=data['date'],
@@ -201,7 +245,7 @@ class Session(db.Model):
         chip_dist = data.get('chip_distribution')
         if chip_dist:
             if isinstance(chip_dist, dict):
-                session.chip_distribution = json.dumps(chip_dist)
+                session.chip_distribution = _json_dumps(chip_dist)
             elif isinstance(chip_dist, str):
                 session.chip_distribution = chip_dist
         
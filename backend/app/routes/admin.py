@@ -11,10 +11,12 @@ from typing import Dict, Any, Optional
 from flask import Blueprint, request, jsonify, session, current_app, render_template, make_response
 from werkzeug.security import check_password_hash
 
+from ..config import default_admin_password_hash
 from ..services.database_service import DatabaseService
 from ..database.models import db, Player, Session, Entry, CalendarEvent, round_to_cents
 from ..database.backup import DatabaseBackup
 from ..database.migration import DataMigration
+from ..utils.request_validation import get_json_body
 
 logger = logging.getLogger(__name__)
 admin_bp = Blueprint('admin', __name__)
@@ -67,7 +69,7 @@ def admin_login() -> Dict[str, Any]:
     Returns:
         JSON response indicating login success or failure
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
     
@@ -75,8 +77,8 @@ def admin_login() -> Dict[str, Any]:
     if not password:
         return jsonify({"error": "Password is required"}), 400
     
-    # Check password against stored hash
-    stored_hash = current_app.config.get('ADMIN_PASSWORD_HASH')
+    # Check password against the configured hash, or the 'admin123' default
+    stored_hash = current_app.config.get('ADMIN_PASSWORD_HASH') or default_admin_password_hash()
     if check_password_hash(stored_hash, password):
         session['admin_authenticated'] = True
         session.permanent = True  # Make session persistent
@@ -141,7 +143,7 @@ def admin_status() -> Dict[str, Any]:
         })
         
     except Exception as e:
-        logger.error(f"Error getting admin status: {str(e)}")
+        logger.error("Error getting admin status: %s", e)
         return jsonify({"error": "Failed to retrieve status"}), 500
 
 
@@ -159,7 +161,7 @@ def admin_get_players() -> Dict[str, Any]:
         players = Player.query.order_by(Player.name).all()
         return jsonify([player.to_dict() for player in players])
     except Exception as e:
-        logger.error(f"Error getting players: {str(e)}")
+        logger.error("Error getting players: %s", e)
         return jsonify({"error": "Failed to retrieve players"}), 500
 
 
@@ -173,7 +175,7 @@ def admin_create_player() -> Dict[str, Any]:
         JSON response with created player information
     """
     try:
-        data = request.get_json()
+        data = get_json_body()
         if not data:
             return jsonify({"error": "Request body is required"}), 400
         
@@ -191,13 +193,13 @@ def admin_create_player() -> Dict[str, Any]:
         player_data = db_service.add_player(name)
         
         if player_data and player_data.get('player_id'):
-            logger.info(f"Admin created new player: {player_data['name']} ({player_data['player_id']})")
+            logger.info("Admin created new player: %s (%s)", player_data['name'], player_data['player_id'])
             return jsonify(player_data), 201
         else:
             return jsonify({"error": "Failed to create player"}), 500
         
     except Exception as e:
-        logger.error(f"Error creating player: {str(e)}")
+        logger.error("Error creating player: %s", e)
         return jsonify({"error": "Failed to create player"}), 500
 
 
@@ -214,7 +216,7 @@ def admin_update_player(player_id: str) -> Dict[str, Any]:
         JSON response with updated player information
     """
     try:
-        data = request.get_json()
+        data = get_json_body()
         if not data:
             return jsonify({"error": "Request body is required"}), 400
         
@@ -230,12 +232,12 @@ def admin_update_player(player_id: str) -> Dict[str, Any]:
         
         db.session.commit()
         
-        logger.info(f"Admin updated player {player_id}")
+        logger.info("Admin updated player %s", player_id)
         return jsonify(player.to_dict())
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating player {player_id}: {str(e)}")
+        logger.error("Error updating player %s: %s", player_id, e)
         return jsonify({"error": "Failed to update player"}), 500
 
 
@@ -274,12 +276,12 @@ def admin_delete_player(player_id: str) -> Dict[str, Any]:
         db.session.delete(player)
         db.session.commit()
         
-        logger.warning(f"Admin deleted player {player_id} (force={force})")
+        logger.warning("Admin deleted player %s (force=%s)", player_id, force)
         return jsonify({"message": f"Player {player_id} deleted successfully"})
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting player {player_id}: {str(e)}")
+        logger.error("Error deleting player %s: %s", player_id, e)
         return jsonify({"error": "Failed to delete player"}), 500
 
 
@@ -295,9 +297,10 @@ def admin_get_sessions() -> Dict[str, Any]:
     """
     try:
         sessions = Session.query.order_by(Session.date.desc()).all()
-        return jsonify([session.to_dict() for session in sessions])
+        totals = DatabaseService().get_session_buy_in_totals()
+        return jsonify([session.to_dict(total_value=totals.get(session.session_id, 0.0)) for session in sessions])
     except Exception as e:
-        logger.error(f"Error getting sessions: {str(e)}")
+        logger.error("Error getting sessions: %s", e)
         return jsonify({"error": "Failed to retrieve sessions"}), 500
 
 
@@ -311,7 +314,7 @@ def admin_create_session() -> Dict[str, Any]:
         JSON response with created session information
     """
     try:
-        data = request.get_json()
+        data = get_json_body()
         if not data:
             return jsonify({"error": "Request body is required"}), 400
         
@@ -340,13 +343,13 @@ def admin_create_session() -> Dict[str, Any]:
         session_data = db_service.create_session(date_str, buy_in_float)
         
         if session_data and session_data.get('session_id'):
-            logger.info(f"Admin created new session: {session_data['date']} ({session_data['session_id']})")
+            logger.info("Admin created new session: %s (%s)", session_data['date'], session_data['session_id'])
             return jsonify(session_data), 201
         else:
             return jsonify({"error": "Failed to create session"}), 500
         
     except Exception as e:
-        logger.error(f"Error creating session: {str(e)}")
+        logger.error("Error creating session: %s", e)
         return jsonify({"error": "Failed to create session"}), 500
 
 
@@ -363,7 +366,7 @@ def admin_update_session(session_id: str) -> Dict[str, Any]:
         JSON response with updated session information
     """
     try:
-        data = request.get_json()
+        data = get_json_body()
         if not data:
             return jsonify({"error": "Request body is required"}), 400
         
@@ -387,14 +390,14 @@ def admin_update_session(session_id: str) -> Dict[str, Any]:
         
         db.session.commit()
         
-        logger.info(f"Admin updated session {session_id}")
+        logger.info("Admin updated session %s", session_id)
         return jsonify(session.to_dict())
         
     except ValueError as e:
         return jsonify({"error": f"Invalid date format: {str(e)}"}), 400
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating session {session_id}: {str(e)}")
+        logger.error("Error updating session %s: %s", session_id, e)
         return jsonify({"error": "Failed to update session"}), 500
 
 
@@ -436,12 +439,12 @@ def admin_delete_session(session_id: str) -> Dict[str, Any]:
         db.session.delete(session)
         db.session.commit()
         
-        logger.warning(f"Admin deleted session {session_id} (force={force})")
+        logger.warning("Admin deleted session %s (force=%s)", session_id, force)
         return jsonify({"message": f"Session {session_id} deleted successfully"})
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting session {session_id}: {str(e)}")
+        logger.error("Error deleting session %s: %s", session_id, e)
         return jsonify({"error": "Failed to delete session"}), 500
 
 
@@ -462,7 +465,7 @@ def admin_get_entries() -> Dict[str, Any]:
         entries = Entry.query.join(Player, Entry.player_id == Player.player_id).join(Session, Entry.session_id == Session.session_id).order_by(Session.date.desc()).all()
         return jsonify([entry.to_dict() for entry in entries])
     except Exception as e:
-        logger.error(f"Error getting entries: {str(e)}")
+        logger.error("Error getting entries: %s", e)
         return jsonify({"error": "Failed to retrieve entries"}), 500
 
 
@@ -479,7 +482,7 @@ def admin_update_entry(entry_id: str) -> Dict[str, Any]:
         JSON response with updated entry information
     """
     try:
-        data = request.get_json()
+        data = get_json_body()
         if not data:
             return jsonify({"error": "Request body is required"}), 400
         
@@ -513,12 +516,12 @@ def admin_update_entry(entry_id: str) -> Dict[str, Any]:
         
         db.session.commit()
         
-        logger.info(f"Admin updated entry {entry_id}")
+        logger.info("Admin updated entry %s", entry_id)
         return jsonify(entry.to_dict())
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error updating entry {entry_id}: {str(e)}")
+        logger.error("Error updating entry %s: %s", entry_id, e)
         return jsonify({"error": "Failed to update entry"}), 500
 
 
@@ -542,12 +545,12 @@ def admin_delete_entry(entry_id: str) -> Dict[str, Any]:
         db.session.delete(entry)
         db.session.commit()
         
-        logger.info(f"Admin deleted entry {entry_id}")
+        logger.info("Admin deleted entry %s", entry_id)
         return jsonify({"message": f"Entry {entry_id} deleted successfully"})
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error deleting entry {entry_id}: {str(e)}")
+        logger.error("Error deleting entry %s: %s", entry_id, e)
         return jsonify({"error": "Failed to delete entry"}), 500
 
 
@@ -562,7 +565,7 @@ def admin_create_backup() -> Dict[str, Any]:
         JSON response with backup information
     """
     try:
-        data = request.get_json() or {}
+        data = get_json_body() or {}
         description = data.get('description', 'Manual admin backup')
         
         db_path = current_app.config.get('SQLALCHEMY_DATABASE_URI', '').replace('sqlite:///', '')
@@ -578,7 +581,7 @@ def admin_create_backup() -> Dict[str, Any]:
         })
         
     except Exception as e:
-        logger.error(f"Error creating backup: {str(e)}")
+        logger.error("Error creating backup: %s", e)
         return jsonify({"error": "Failed to create backup"}), 500
 
 
@@ -601,7 +604,7 @@ def admin_list_backups() -> Dict[str, Any]:
         return jsonify(backups)
         
     except Exception as e:
-        logger.error(f"Error listing backups: {str(e)}")
+        logger.error("Error listing backups: %s", e)
         return jsonify({"error": "Failed to list backups"}), 500
 
 
@@ -615,7 +618,7 @@ def admin_migrate_data() -> Dict[str, Any]:
         JSON response with migration results
     """
     try:
-        data = request.get_json() or {}
+        data = get_json_body() or {}
         backup_first = data.get('backup_first', True)
         
         # Get JSON data directory path
@@ -643,5 +646,5 @@ def admin_migrate_data() -> Dict[str, Any]:
         return jsonify(migration_results)
         
     except Exception as e:
-        logger.error(f"Error during migration: {str(e)}")
+        logger.error("Error during migration: %s", e)
         return jsonify({"error": f"Migration failed: {str(e)}"}), 500
\ No newline at end of file
@@ -9,15 +9,16 @@ from datetime import datetime
 from flask import Blueprint, jsonify, request
 
 from ..services.database_service import DatabaseService
+from ..utils.request_validation import get_json_body
 
 try:
-    from scripts.chip_calculator import calculate_chip_distribution
+    from scripts.chip_calculator import cached_chip_data as calculate_chip_data
 except ImportError:
     try:
-        from chip_calculator import calculate_chip_distribution
+        from chip_calculator import cached_chip_data as calculate_chip_data
     except ImportError:
-        def calculate_chip_distribution(buy_in):
-            return {}
+        def calculate_chip_data(buy_in):
+            return None
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ def get_events_api():
 @calendar_bp.route('/events', methods=['POST'])
 def create_event_api():
     """Create a new calendar event."""
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
 
@@ -107,7 +108,7 @@ def get_event_api(event_id):
 @calendar_bp.route('/events/<string:event_id>', methods=['PUT'])
 def update_event_api(event_id):
     """Update a calendar event."""
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
 
@@ -167,21 +168,17 @@ def start_session_from_event(event_id):
     if event.session_id:
         return jsonify({"error": "Event already has a linked session", "session_id": event.session_id}), 409
 
-    # Create the session
+    # Create the session along with its chip distribution
+    chip_data = calculate_chip_data(event.default_buy_in_value) or {}
     session = db_service.create_session(
         date_str=event.date,
-        default_buy_in_value=event.default_buy_in_value
+        default_buy_in_value=event.default_buy_in_value,
+        chip_distribution=chip_data.get('distribution'),
+        total_chips=chip_data.get('total')
     )
     if not session:
         return jsonify({"error": "Failed to create session"}), 500
 
-    # Calculate and store chip distribution
-    chip_distribution = calculate_chip_distribution(session.default_buy_in_value)
-    if chip_distribution:
-        session.chip_distribution = chip_distribution
-        session.total_chips = sum(chip_distribution.values())
-        db_service.update_session(session.session_id, session)
-
     # Link event to session
     event = db_service.update_event(event_id, session_id=session.session_id)
 
@@ -204,7 +201,7 @@ def start_session_from_event(event_id):
 @calendar_bp.route('/events/<string:event_id>/rsvp', methods=['POST'])
 def rsvp_event_api(event_id):
     """Create or update an RSVP for an event."""
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
 
@@ -5,28 +5,32 @@ This module contains chip calculation API endpoints.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from flask import Blueprint, jsonify
 
+from ..utils.cache import cached_response
+from ..utils.request_validation import error_response
+
 logger = logging.getLogger(__name__)
 
 # Import chip calculator from scripts directory
 try:
-    from scripts.chip_calculator import calculate_chip_distribution
+    from scripts.chip_calculator import cached_chip_data as calculate_chip_data
 except ImportError:
     try:
         # Fallback: try importing from current path (if scripts dir was added to sys.path)
-        from chip_calculator import calculate_chip_distribution
+        from chip_calculator import cached_chip_data as calculate_chip_data
     except ImportError:
         logger.warning("Could not import chip_calculator. Chip distribution functionality may not work.")
         
-        def calculate_chip_distribution(buy_in: float) -> Dict[str, int]:
+        def calculate_chip_data(buy_in: float) -> Optional[Dict[str, Any]]:
             """Fallback function if chip_calculator is not available."""
-            return {}
+            return None
 chip_calculator_bp = Blueprint('chip_calculator', __name__)
 
 
 @chip_calculator_bp.route('/chip-calculator/<float:buy_in>', methods=['GET'])
+@cached_response(timeout=3600, persistent=True, key_func=lambda buy_in: f"chip-calculator:{buy_in!r}")
 def get_chip_distribution_api(buy_in: float) -> Dict[str, Any]:
     """
     Calculate chip distribution for a specific buy-in amount.
@@ -40,24 +44,21 @@ def get_chip_distribution_api(buy_in: float) -> Dict[str, Any]:
     try:
         # Validate buy-in amount
         if buy_in <= 0:
-            return jsonify({"error": "Buy-in amount must be positive"}), 400
-        
-        # Calculate chip distribution
-        chip_distribution = calculate_chip_distribution(buy_in)
+            return error_response("Buy-in amount must be positive", 400)
         
-        if not chip_distribution:
-            return jsonify({"error": "Failed to calculate chip distribution"}), 500
+        # Calculate chip distribution and total chip count
+        chip_data = calculate_chip_data(buy_in)
         
-        # Calculate total chip count
-        total_chips = sum(chip_distribution.values())
+        if not chip_data:
+            return error_response("Failed to calculate chip distribution", 500)
         
         # Return the distribution data
         return jsonify({
             "buy_in": buy_in,
-            "chip_distribution": chip_distribution,
-            "total_chips": total_chips
+            "chip_distribution": chip_data['distribution'],
+            "total_chips": chip_data['total']
         })
     
     except Exception as e:
-        logger.error(f"Error calculating chip distribution: {str(e)}")
+        logger.error("Error calculating chip distribution: %s", e)
         return jsonify({"error": f"An error occurred: {str(e)}"}), 500
\ No newline at end of file
@@ -5,31 +5,32 @@ This module provides a secure endpoint that exposes only non-sensitive
 configuration values to the frontend.
 """
 
-from flask import Blueprint, jsonify
-from app.config import Config
+from flask import Blueprint, current_app, jsonify
+
+from ..utils.cache import cached_response
 
 config_bp = Blueprint('config', __name__)
 
 @config_bp.route('/config', methods=['GET'])
+@cached_response(timeout=3600, persistent=True)
 def get_public_config():
     """
     Get public configuration values safe for frontend use.
     
     Only exposes non-sensitive configuration that the frontend needs.
-    Never exposes secrets, passwords, or private keys.
+    Never exposes secrets, passwords, or private keys. The values are
+    fixed for the life of the process, so the response is cached.
     
     Returns:
         JSON response with public configuration values
     """
-    config = Config()
-    
     # Only expose safe, non-sensitive configuration values
     public_config = {
-        'APP_VERSION': getattr(config, 'APP_VERSION', '1.0.0'),
+        'APP_VERSION': current_app.config.get('APP_VERSION', '1.0.0'),
         'API_BASE_URL': '/api',
         'CACHE_NAME_PREFIX': 'gamble-king-cache',
-        'DEBUG_MODE': getattr(config, 'DEBUG', False),
+        'DEBUG_MODE': current_app.debug,
         'CACHE_BUST_VALUE': 1
     }
     
-    return jsonify(public_config)
\ No newline at end of file
+    return jsonify(public_config)
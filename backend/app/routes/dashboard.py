@@ -28,7 +28,7 @@ def get_dashboard_api() -> Response:
         
         # Get basic counts
         players = db_service.get_all_players()
-        sessions = db_service.get_all_sessions()
+        sessions = db_service.get_all_sessions_with_entries()
         
         # Get recent active session if any
         active_sessions = [s for s in sessions if s.is_active]
@@ -39,12 +39,10 @@ def get_dashboard_api() -> Response:
         total_payouts = 0.0
         
         for session in sessions:
-            session_details = db_service.get_session_by_id(session.session_id)
-            if session_details and hasattr(session_details, 'entries'):
-                entries = session_details.entries or []
-                total_entries += len(entries)
-                total_buy_ins += sum(entry.total_buy_in_amount for entry in entries)
-                total_payouts += sum(entry.payout for entry in entries)
+            entries = session.entries
+            total_entries += len(entries)
+            total_buy_ins += sum(entry.total_buy_in_amount for entry in entries)
+            total_payouts += sum(entry.payout for entry in entries)
         
         dashboard_data = {
             "total_players": len(players),
@@ -59,5 +57,5 @@ def get_dashboard_api() -> Response:
         return api_response_no_cache(dashboard_data)
         
     except Exception as e:
-        logger.error(f"Error loading dashboard data: {str(e)}")
+        logger.error("Error loading dashboard data: %s", e)
         return api_response_no_cache({"error": "Failed to load dashboard data"}), 500
\ No newline at end of file
@@ -4,77 +4,104 @@ Frontend routes for Poker Night PWA.
 This module contains routes for serving static frontend files.
 """
 
+import hashlib
 import os
 import logging
-from typing import Any
-from flask import Blueprint, render_template, send_from_directory, Response, abort
-
-from ..config import Config
+from typing import Any, Dict, Tuple
+from flask import Blueprint, render_template, request, Response, abort, current_app
 
 logger = logging.getLogger(__name__)
 frontend_bp = Blueprint('frontend', __name__)
 
+# PWA bootstrap files may be stored by the browser but must be revalidated
+# on every use, so a new deploy is picked up on the next page load
+REVALIDATE_HEADERS = {
+    'Cache-Control': 'no-cache'
+}
+
+# File contents (and rendered pages) keyed by path, built once and reused for every request
+_file_cache: Dict[str, bytes] = {}
+
+# Revalidated files keyed by path: (contents, ETag). Both are stored in one
+# tuple so a concurrent request can never see a body without its ETag.
+_revalidated_files: Dict[str, Tuple[bytes, str]] = {}
+
+
+def _revalidated_file_response(directory: str, filename: str, mimetype: str) -> Response:
+    """
+    Build a must-revalidate response for a file kept in memory after its first read.
+    
+    The response carries an ETag of the file contents, so a browser
+    revalidating an unchanged file gets an empty 304. The file is re-read
+    on every request in debug mode so edits show up without restarting
+    the server.
+    
+    Args:
+        directory: Directory containing the file
+        filename: Name of the file to serve
+        mimetype: Content type of the response
+        
+    Returns:
+        Response with the file contents and revalidation headers
+    """
+    path = os.path.join(directory, filename)
+    cached = _revalidated_files.get(path)
+    if cached is None or current_app.debug:
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            abort(404)
+        cached = _revalidated_files[path] = (body, hashlib.md5(body).hexdigest())
+    body, etag = cached
+    
+    response = Response(body, mimetype=mimetype)
+    response.headers.update(REVALIDATE_HEADERS)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
 
 @frontend_bp.route('/', methods=['GET', 'POST'])
-def serve_index() -> str:
+def serve_index() -> Response:
     """
     Serve the main index page.
     
+    The page only depends on the app version, so it is rendered once and
+    the HTML is reused (re-rendered every time in debug mode).
+    
     Returns:
         Rendered HTML template
     """
-    return render_template('index.html')
+    body = _file_cache.get('index.html')
+    if body is None or current_app.debug:
+        body = render_template('index.html').encode('utf-8')
+        _file_cache['index.html'] = body
+    return Response(body, mimetype='text/html')
 
 
 @frontend_bp.route('/manifest.json')
 def serve_manifest() -> Response:
     """
-    Serve the PWA manifest file with no-cache headers.
+    Serve the PWA manifest file, revalidated on every use.
     
     Returns:
         Manifest JSON file with cache-control headers
     """
-    config = Config()
-    response = send_from_directory(config.FRONTEND_DIR, 'manifest.json')
-    
-    # Set headers to prevent caching
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
-    
-    return response
+    return _revalidated_file_response(
+        current_app.config['FRONTEND_DIR'], 'manifest.json', 'application/manifest+json'
+    )
 
 
 @frontend_bp.route('/sw.js')
 def serve_sw() -> Response:
     """
-    Serve the service worker file with no-cache headers.
+    Serve the service worker file, revalidated on every use.
     
     Returns:
         Service worker JavaScript file with cache-control headers
     """
-    config = Config()
     # static_folder is STATIC_DIR, so sw.js should be in STATIC_DIR/js/
-    response = send_from_directory(
-        os.path.join(config.STATIC_DIR, 'js'), 
-        'sw.js'
+    return _revalidated_file_response(
+        os.path.join(current_app.config['STATIC_DIR'], 'js'), 'sw.js', 'application/javascript'
     )
-    
-    # Set headers to prevent caching
-    response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
-    
-    return response
-
 
-@frontend_bp.route('/.env')
-def block_env_file() -> None:
-    """
-    Explicitly block access to .env file.
-    
-    Raises:
-        404 error for .env file access attempts
-    """
-    logger.warning("Blocked access attempt to .env file")
-    abort(404)
\ No newline at end of file
@@ -7,11 +7,12 @@ This module contains all push notification-related API endpoints.
 import json
 import logging
 from typing import Dict, Any
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify
 
 from ..services.database_service import DatabaseService
 from ..services.notification_service import NotificationService
 from ..database.models import db, PushSubscription
+from ..utils.request_validation import get_json_body, validate_ids
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,7 @@ def subscribe_to_notifications() -> Dict[str, Any]:
     Returns:
         JSON response with success message or error
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
     
@@ -94,7 +95,7 @@ def subscribe_to_notifications() -> Dict[str, Any]:
             existing_subscription.auth = auth
             existing_subscription.p256dh = p256dh
             db.session.commit()
-            logger.info(f"Updated push subscription for player {player_id} in session {session_id}")
+            logger.info("Updated push subscription for player %s in session %s", player_id, session_id)
         else:
             # Create new subscription
             new_subscription = PushSubscription(
@@ -107,13 +108,13 @@ def subscribe_to_notifications() -> Dict[str, Any]:
             )
             db.session.add(new_subscription)
             db.session.commit()
-            logger.info(f"Created new push subscription for player {player_id} in session {session_id}")
+            logger.info("Created new push subscription for player %s in session %s", player_id, session_id)
         
         return jsonify({"message": "Successfully subscribed to notifications"}), 201
         
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error creating push subscription: {str(e)}")
+        logger.error("Error creating push subscription: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 
@@ -131,7 +132,7 @@ def unsubscribe_from_notifications() -> Dict[str, Any]:
     Returns:
         JSON response with success message or error
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Request body is required"}), 400
     
@@ -156,18 +157,19 @@ def unsubscribe_from_notifications() -> Dict[str, Any]:
         if subscription:
             subscription.is_active = False
             db.session.commit()
-            logger.info(f"Deactivated push subscription for player {player_id} in session {session_id}")
+            logger.info("Deactivated push subscription for player %s in session %s", player_id, session_id)
             return jsonify({"message": "Successfully unsubscribed from notifications"})
         else:
             return jsonify({"error": "No active subscription found"}), 404
             
     except Exception as e:
         db.session.rollback()
-        logger.error(f"Error unsubscribing from notifications: {str(e)}")
+        logger.error("Error unsubscribing from notifications: %s", e)
         return jsonify({"error": "Internal server error"}), 500
 
 
 @notifications_bp.route('/subscriptions/<string:player_id>', methods=['GET'])
+@validate_ids
 def get_player_subscriptions(player_id: str) -> Dict[str, Any]:
     """
     Get all active subscriptions for a player.
@@ -178,9 +180,6 @@ def get_player_subscriptions(player_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with list of active subscriptions
     """
-    if not player_id or not isinstance(player_id, str):
-        return jsonify({"error": "Invalid player ID"}), 400
-    
     try:
         subscriptions = PushSubscription.query.filter_by(
             player_id=player_id,
@@ -190,7 +189,7 @@ def get_player_subscriptions(player_id: str) -> Dict[str, Any]:
         return jsonify([sub.to_dict() for sub in subscriptions])
         
     except Exception as e:
-        logger.error(f"Error fetching subscriptions for player {player_id}: {str(e)}")
+        logger.error("Error fetching subscriptions for player %s: %s", player_id, e)
         return jsonify({"error": "Internal server error"}), 500
 
 
@@ -242,5 +241,5 @@ def get_vapid_public_key() -> Dict[str, Any]:
         return jsonify({"vapid_public_key": browser_key})
         
     except Exception as e:
-        logger.error(f"Error generating VAPID public key: {str(e)}")
+        logger.error("Error generating VAPID public key: %s", e)
         return jsonify({"error": "Failed to generate VAPID public key"}), 500
\ No newline at end of file
@@ -6,15 +6,18 @@ This module contains all player-related API endpoints.
 
 import logging
 from typing import Dict, Any
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify
 
 from ..services.database_service import DatabaseService
+from ..utils.cache import cached_response
+from ..utils.request_validation import get_json_body, error_response, validate_ids, MAX_JSON_BODY_SIZE
 
 logger = logging.getLogger(__name__)
 players_bp = Blueprint('players', __name__)
 
 
 @players_bp.route('/players', methods=['GET'])
+@cached_response()
 def get_players() -> Dict[str, Any]:
     """
     Get all players with summary statistics.
@@ -28,6 +31,7 @@ def get_players() -> Dict[str, Any]:
 
 
 @players_bp.route('/players/details', methods=['GET'])
+@cached_response()
 def get_all_players_details() -> Dict[str, Any]:
     """
     Get all players with detailed information.
@@ -48,29 +52,31 @@ def add_player_api() -> Dict[str, Any]:
     Returns:
         JSON response with player statistics or error message
     """
-    data = request.get_json()
+    data = get_json_body(max_size=MAX_JSON_BODY_SIZE)
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
     
     name = data.get('name')
     if not name or not isinstance(name, str):
-        return jsonify({"error": "Name is required and must be a string"}), 400
+        return error_response("Name is required and must be a string", 400)
     
     # Validate name length and characters
     name = name.strip()
     if len(name) < 1 or len(name) > 50:
-        return jsonify({"error": "Name must be between 1 and 50 characters"}), 400
+        return error_response("Name must be between 1 and 50 characters", 400)
     
     db_service = DatabaseService()
     player = db_service.add_player(name)
     if player:
-        stats = db_service.get_player_overall_stats(player.player_id)
+        stats = db_service.get_player_stats(player)
         return jsonify(stats.to_dict()), 201
     else:
-        return jsonify({"error": "Could not add or retrieve player properly"}), 500
+        return error_response("Could not add or retrieve player properly", 500)
 
 
 @players_bp.route('/players/<string:player_id>/stats', methods=['GET'])
+@validate_ids
+@cached_response()
 def get_player_stats_api(player_id: str) -> Dict[str, Any]:
     """
     Get statistics for a specific player.
@@ -82,23 +88,21 @@ def get_player_stats_api(player_id: str) -> Dict[str, Any]:
         JSON response with player statistics or error message
     """
     try:
-        # Validate player ID format
-        if not player_id or not isinstance(player_id, str):
-            return jsonify({"error": "Invalid player ID"}), 400
-        
         db_service = DatabaseService()
-        player_check = db_service.get_player_by_id(player_id)
-        if not player_check:
-            return jsonify({"error": "Player not found"}), 404
+        player = db_service.get_player_by_id(player_id)
+        if not player:
+            return error_response("Player not found", 404)
         
-        stats = db_service.get_player_overall_stats(player_id)
+        stats = db_service.get_player_stats(player)
         return jsonify(stats.to_dict())
     except Exception as e:
-        logger.error(f"Error getting player stats: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error getting player stats: %s", e)
+        return error_response("Internal server error", 500)
 
 
 @players_bp.route('/players/<string:player_id>/history', methods=['GET'])
+@validate_ids
+@cached_response()
 def get_player_history_api(player_id: str) -> Dict[str, Any]:
     """
     Get session history for a specific player.
@@ -110,22 +114,20 @@ def get_player_history_api(player_id: str) -> Dict[str, Any]:
         JSON response with player session history or error message
     """
     try:
-        if not player_id or not isinstance(player_id, str):
-            return jsonify({"error": "Invalid player ID"}), 400
-        
         db_service = DatabaseService()
-        player_check = db_service.get_player_by_id(player_id)
-        if not player_check:
-            return jsonify({"error": "Player not found"}), 404
-        
         history = db_service.get_player_session_history(player_id)
+        # A player with history exists, so only look them up when there is none
+        if not history and not db_service.get_player_by_id(player_id):
+            return error_response("Player not found", 404)
+        
         return jsonify([h.to_dict() for h in history])
     except Exception as e:
-        logger.error(f"Error getting player history: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error getting player history: %s", e)
+        return error_response("Internal server error", 500)
 
 
 @players_bp.route('/players/<string:player_id>/seven-two-wins', methods=['PUT'])
+@validate_ids
 def increment_seven_two_wins_api(player_id: str) -> Dict[str, Any]:
     """
     Increment the 7-2 wins counter for a player.
@@ -137,25 +139,22 @@ def increment_seven_two_wins_api(player_id: str) -> Dict[str, Any]:
         JSON response with updated player statistics or error message
     """
     try:
-        if not player_id or not isinstance(player_id, str):
-            return jsonify({"error": "Invalid player ID"}), 400
-        
         db_service = DatabaseService()
-        player_check = db_service.get_player_by_id(player_id)
-        if not player_check:
-            return jsonify({"error": "Player not found"}), 404
-        
-        if db_service.increment_seven_two_wins(player_id):
-            stats = db_service.get_player_overall_stats(player_id)
+        player = db_service.increment_seven_two_wins(player_id)
+        if player:
+            stats = db_service.get_player_stats(player)
             return jsonify(stats.to_dict())
         
-        return jsonify({"error": "Failed to update 7-2 wins count"}), 500
+        if not db_service.get_player_by_id(player_id):
+            return error_response("Player not found", 404)
+        return error_response("Failed to update 7-2 wins count", 500)
     except Exception as e:
-        logger.error(f"Error incrementing 7-2 wins: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error incrementing 7-2 wins: %s", e)
+        return error_response("Internal server error", 500)
 
 
 @players_bp.route('/players/<string:player_id>/seven-two-wins/decrement', methods=['PUT'])
+@validate_ids
 def decrement_seven_two_wins_api(player_id: str) -> Dict[str, Any]:
     """
     Decrement the 7-2 wins counter for a player.
@@ -167,25 +166,23 @@ def decrement_seven_two_wins_api(player_id: str) -> Dict[str, Any]:
         JSON response with updated player statistics or error message
     """
     try:
-        if not player_id or not isinstance(player_id, str):
-            return jsonify({"error": "Invalid player ID"}), 400
-
         db_service = DatabaseService()
-        player_check = db_service.get_player_by_id(player_id)
-        if not player_check:
-            return jsonify({"error": "Player not found"}), 404
-
-        if db_service.decrement_seven_two_wins(player_id):
-            stats = db_service.get_player_overall_stats(player_id)
+        player = db_service.decrement_seven_two_wins(player_id)
+        if player:
+            stats = db_service.get_player_stats(player)
             return jsonify(stats.to_dict())
 
-        return jsonify({"error": "Failed to decrement 7-2 wins count"}), 500
+        if not db_service.get_player_by_id(player_id):
+            return error_response("Player not found", 404)
+        return error_response("Failed to decrement 7-2 wins count", 500)
     except Exception as e:
-        logger.error(f"Error decrementing 7-2 wins: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error decrementing 7-2 wins: %s", e)
+        return error_response("Internal server error", 500)
 
 
 @players_bp.route('/players/<string:player_id>/profit-over-time', methods=['GET'])
+@validate_ids
+@cached_response()
 def get_player_profit_over_time_api(player_id: str) -> Dict[str, Any]:
     """
     Get profit/loss data over time for a specific player for chart visualization.
@@ -197,18 +194,15 @@ def get_player_profit_over_time_api(player_id: str) -> Dict[str, Any]:
         JSON response with cumulative profit data over time or error message
     """
     try:
-        if not player_id or not isinstance(player_id, str):
-            return jsonify({"error": "Invalid player ID"}), 400
-
         db_service = DatabaseService()
-        player_check = db_service.get_player_by_id(player_id)
-        if not player_check:
-            return jsonify({"error": "Player not found"}), 404
 
         # Get player's session history
         history = db_service.get_player_session_history(player_id)
 
         if not history:
+            if not db_service.get_player_by_id(player_id):
+                return error_response("Player not found", 404)
+
             return jsonify({
                 'data': [],
                 'total_profit': 0,
@@ -250,5 +244,5 @@ def get_player_profit_over_time_api(player_id: str) -> Dict[str, Any]:
         })
 
     except Exception as e:
-        logger.error(f"Error getting player profit over time: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
\ No newline at end of file
+        logger.error("Error getting player profit over time: %s", e)
+        return error_response("Internal server error", 500)
\ No newline at end of file
@@ -5,31 +5,38 @@ This module contains all session-related API endpoints.
 """
 
 import logging
-from typing import Dict, Any
-from datetime import datetime
-from flask import Blueprint, jsonify, request
+from typing import Dict, Any, Optional
+from datetime import date
+from flask import Blueprint, jsonify
 
+from ..database.models import _json_dumps
 from ..services.database_service import DatabaseService
+from ..utils.cache import cached_response
+from ..utils.request_validation import get_json_body, error_response, validate_ids, MAX_JSON_BODY_SIZE
 
 logger = logging.getLogger(__name__)
 
 # Import chip calculator from scripts directory
 try:
-    from scripts.chip_calculator import calculate_chip_distribution
+    from scripts.chip_calculator import cached_chip_data as calculate_chip_data
 except ImportError:
     try:
         # Fallback: try importing from current path (if scripts dir was added to sys.path)
-        from chip_calculator import calculate_chip_distribution
+        from chip_calculator import cached_chip_data as calculate_chip_data
     except ImportError:
         logger.warning("Could not import chip_calculator. Chip distribution functionality may not work.")
         
-        def calculate_chip_distribution(buy_in: float) -> Dict[str, int]:
+        def calculate_chip_data(buy_in: float) -> Optional[Dict[str, Any]]:
             """Fallback function if chip_calculator is not available."""
-            return {}
+            return None
 sessions_bp = Blueprint('sessions', __name__)
 
+# Session IDs already checked for a missing chip distribution in this process
+_chip_distribution_checked = set()
+
 
 @sessions_bp.route('/sessions', methods=['GET'])
+@cached_response()
 def get_sessions_api() -> Dict[str, Any]:
     """
     Get all sessions.
@@ -39,10 +46,12 @@ def get_sessions_api() -> Dict[str, Any]:
     """
     db_service = DatabaseService()
     sessions = db_service.get_all_sessions()
-    return jsonify([session.to_dict() for session in sessions])
+    totals = db_service.get_session_buy_in_totals()
+    return jsonify([session.to_dict(total_value=totals.get(session.session_id, 0.0)) for session in sessions])
 
 
 @sessions_bp.route('/sessions/active', methods=['GET'])
+@cached_response()
 def get_active_sessions_api() -> Dict[str, Any]:
     """
     Get all active sessions.
@@ -52,7 +61,8 @@ def get_active_sessions_api() -> Dict[str, Any]:
     """
     db_service = DatabaseService()
     sessions = db_service.get_active_sessions()
-    return jsonify([session.to_dict() for session in sessions])
+    totals = db_service.get_session_buy_in_totals()
+    return jsonify([session.to_dict(total_value=totals.get(session.session_id, 0.0)) for session in sessions])
 
 
 @sessions_bp.route('/sessions', methods=['POST'])
@@ -63,54 +73,47 @@ def create_session_api() -> Dict[str, Any]:
     Returns:
         JSON response with created session or error message
     """
-    data = request.get_json()
+    data = get_json_body(max_size=MAX_JSON_BODY_SIZE)
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
     
     date_str = data.get('date')
     buy_in_value = data.get('default_buy_in_value', 20.00)
     
     if not date_str or not isinstance(date_str, str):
-        return jsonify({"error": "Date is required and must be a string"}), 400
+        return error_response("Date is required and must be a string", 400)
     
-    # Validate date format
+    # Validate date format (fromisoformat also accepts other ISO forms,
+    # so require the parsed date to round-trip to the same string)
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        if date.fromisoformat(date_str).isoformat() != date_str:
+            raise ValueError(date_str)
     except ValueError:
-        return jsonify({"error": "Invalid date format. Use YYYY-MM-DD"}), 400
+        return error_response("Invalid date format. Use YYYY-MM-DD", 400)
     
     try:
         buy_in_float = float(buy_in_value)
         if buy_in_float <= 0 or buy_in_float > 10000:
-            return jsonify({"error": "Buy-in value must be between 0.01 and 10000"}), 400
+            return error_response("Buy-in value must be between 0.01 and 10000", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "Invalid buy-in value"}), 400
+        return error_response("Invalid buy-in value", 400)
     
     # Calculate chip distribution for the session
-    chip_distribution = calculate_chip_distribution(buy_in_float)
+    chip_data = calculate_chip_data(buy_in_float) or {}
     
-    # Create the session
+    # Create the session with its chip distribution in a single write
     db_service = DatabaseService()
-    session = db_service.create_session(date_str, buy_in_float)
+    session = db_service.create_session(
+        date_str, buy_in_float, chip_data.get('distribution'), chip_data.get('total')
+    )
     if session:
-        # Add chip distribution to the session data
-        if chip_distribution:
-            import json
-            session.chip_distribution = json.dumps(chip_distribution)
-            # Calculate total chip count for convenience
-            session.total_chips = sum(chip_distribution.values())
-            
-            # Update the session in the database to persist the chip distribution
-            from ..database.models import db
-            db.session.commit()
-            
-            logger.info(f"Session created with ID: {session.session_id}")
-        
         return jsonify(session.to_dict()), 201
-    return jsonify({"error": "Failed to create session"}), 500
+    return error_response("Failed to create session", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>', methods=['GET'])
+@validate_ids
+@cached_response()
 def get_session_details_api(session_id: str) -> Dict[str, Any]:
     """
     Get details for a specific session.
@@ -122,19 +125,21 @@ def get_session_details_api(session_id: str) -> Dict[str, Any]:
         JSON response with session details and entries
     """
     db_service = DatabaseService()
-    session = db_service.get_session_by_id(session_id)
+    session = db_service.get_session_with_entries(session_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
+        return error_response("Session not found", 404)
     
-    entries = db_service.get_entries_for_session(session_id)
+    entries = session.entries
     
     # Check if chip distribution is already in the session data
-    # If not, calculate it based on the session's buy-in value
-    if session.chip_distribution is None:
-        chip_distribution = calculate_chip_distribution(session.default_buy_in_value)
-        if chip_distribution:
-            session.chip_distribution = chip_distribution
-            session.total_chips = sum(chip_distribution.values())
+    # If not, calculate it based on the session's buy-in value. Startup
+    # backfills these, so this only tries once per session per process.
+    if session.chip_distribution is None and session_id not in _chip_distribution_checked:
+        _chip_distribution_checked.add(session_id)
+        chip_data = calculate_chip_data(session.default_buy_in_value)
+        if chip_data:
+            session.chip_distribution = _json_dumps(chip_data['distribution'])
+            session.total_chips = chip_data['total']
             
             # Save the updated session with chip distribution
             db_service.update_session(session.session_id, session)
@@ -149,6 +154,7 @@ def get_session_details_api(session_id: str) -> Dict[str, Any]:
 
 
 @sessions_bp.route('/sessions/<string:session_id>/end', methods=['PUT'])
+@validate_ids
 def end_session_api(session_id: str) -> Dict[str, Any]:
     """
     End a session.
@@ -162,10 +168,11 @@ def end_session_api(session_id: str) -> Dict[str, Any]:
     db_service = DatabaseService()
     if db_service.end_session(session_id):
         return jsonify({"message": "Session ended successfully"})
-    return jsonify({"error": "Failed to end session or session not found"}), 404
+    return error_response("Failed to end session or session not found", 404)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/reactivate', methods=['PUT'])
+@validate_ids
 def reactivate_session_api(session_id: str) -> Dict[str, Any]:
     """
     Reactivate a session.
@@ -179,10 +186,11 @@ def reactivate_session_api(session_id: str) -> Dict[str, Any]:
     db_service = DatabaseService()
     if db_service.reactivate_session(session_id):
         return jsonify({"message": "Session reactivated successfully"})
-    return jsonify({"error": "Failed to reactivate session or session not found"}), 404
+    return error_response("Failed to reactivate session or session not found", 404)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/delete', methods=['DELETE'])
+@validate_ids
 def delete_session_api(session_id: str) -> Dict[str, Any]:
     """
     Delete (archive) a session.
@@ -198,18 +206,19 @@ def delete_session_api(session_id: str) -> Dict[str, Any]:
     # First check if the session exists
     session = db_service.get_session_by_id(session_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
+        return error_response("Session not found", 404)
     
     # Check if session is active - can't delete active sessions
     if session.is_active:
-        return jsonify({"error": "Cannot delete an active session. End the session first."}), 400
+        return error_response("Cannot delete an active session. End the session first.", 400)
     
     # TODO: Implement session deletion/archiving logic
     # For now, return a placeholder response
-    return jsonify({"error": "Session deletion not yet implemented"}), 501
+    return error_response("Session deletion not yet implemented", 501)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries', methods=['POST'])
+@validate_ids
 def add_player_to_session_api(session_id: str) -> Dict[str, Any]:
     """
     Add a player entry to a session.
@@ -220,26 +229,22 @@ def add_player_to_session_api(session_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with all session entries or error message
     """
-    data = request.get_json()
+    data = get_json_body(max_size=MAX_JSON_BODY_SIZE)
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
     
     player_id = data.get('player_id')
     num_buy_ins_str = data.get('num_buy_ins', "1")
     
     if not player_id or not isinstance(player_id, str):
-        return jsonify({"error": "Player ID is required and must be a string"}), 400
-    
-    # Validate session_id format
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
+        return error_response("Player ID is required and must be a string", 400)
     
     try:
         num_buy_ins = int(num_buy_ins_str)
         if num_buy_ins <= 0 or num_buy_ins > 100:
-            return jsonify({"error": "Number of buy-ins must be between 1 and 100"}), 400
+            return error_response("Number of buy-ins must be between 1 and 100", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "Invalid number of buy-ins"}), 400
+        return error_response("Invalid number of buy-ins", 400)
     
     db_service = DatabaseService()
     entry = db_service.record_player_entry(session_id, player_id, num_buy_ins)
@@ -248,16 +253,16 @@ def add_player_to_session_api(session_id: str) -> Dict[str, Any]:
         return jsonify([entry.to_dict() for entry in all_entries]), 201
     
     # Check for specific errors
-    session_check = db_service.get_session_by_id(session_id)
+    session_check, player_check = db_service.get_session_and_player(session_id, player_id)
     if not session_check:
         return jsonify({"error": f"Session {session_id} not found."}), 404
-    player_check = db_service.get_player_by_id(player_id)
     if not player_check:
         return jsonify({"error": f"Player {player_id} not found."}), 404
-    return jsonify({"error": "Failed to add player entry for an unknown reason"}), 500
+    return error_response("Failed to add player entry for an unknown reason", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/bulk', methods=['POST'])
+@validate_ids
 def add_players_to_session_bulk_api(session_id: str) -> Dict[str, Any]:
     """
     Add multiple new players to a session in a single request.
@@ -268,38 +273,35 @@ def add_players_to_session_bulk_api(session_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with all session entries or error message
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
 
     player_ids = data.get('player_ids')
     num_buy_ins_str = data.get('num_buy_ins', "1")
 
     if not isinstance(player_ids, list) or len(player_ids) == 0:
-        return jsonify({"error": "player_ids must be a non-empty array"}), 400
+        return error_response("player_ids must be a non-empty array", 400)
 
     if any(not isinstance(player_id, str) or not player_id for player_id in player_ids):
-        return jsonify({"error": "Each player ID must be a non-empty string"}), 400
+        return error_response("Each player ID must be a non-empty string", 400)
 
     if len(set(player_ids)) != len(player_ids):
-        return jsonify({"error": "Duplicate players cannot be added in the same request"}), 400
-
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
+        return error_response("Duplicate players cannot be added in the same request", 400)
 
     try:
         num_buy_ins = int(num_buy_ins_str)
         if num_buy_ins <= 0 or num_buy_ins > 100:
-            return jsonify({"error": "Number of buy-ins must be between 1 and 100"}), 400
+            return error_response("Number of buy-ins must be between 1 and 100", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "Invalid number of buy-ins"}), 400
+        return error_response("Invalid number of buy-ins", 400)
 
     db_service = DatabaseService()
     session = db_service.get_session_by_id(session_id)
     if not session:
         return jsonify({"error": f"Session {session_id} not found."}), 404
     if not session.is_active:
-        return jsonify({"error": "Cannot add players to a session that has ended."}), 400
+        return error_response("Cannot add players to a session that has ended.", 400)
 
     missing_player_ids = [player_id for player_id in player_ids if not db_service.get_player_by_id(player_id)]
     if missing_player_ids:
@@ -309,17 +311,18 @@ def add_players_to_session_bulk_api(session_id: str) -> Dict[str, Any]:
     existing_player_ids = {entry.player_id for entry in existing_entries}
     already_in_session = [player_id for player_id in player_ids if player_id in existing_player_ids]
     if already_in_session:
-        return jsonify({"error": "Some selected players are already in this session."}), 400
+        return error_response("Some selected players are already in this session.", 400)
 
     created_entries = db_service.add_players_to_session_bulk(session_id, player_ids, num_buy_ins)
     if created_entries is not None:
         all_entries = db_service.get_entries_for_session(session_id)
         return jsonify([entry.to_dict() for entry in all_entries]), 201
 
-    return jsonify({"error": "Failed to add players to the session."}), 500
+    return error_response("Failed to add players to the session.", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/<string:player_id>/remove-buyin', methods=['PUT'])
+@validate_ids
 def remove_buyin_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Remove a buy-in from a player in a session.
@@ -339,19 +342,19 @@ def remove_buyin_api(session_id: str, player_id: str) -> Dict[str, Any]:
         return jsonify([entry.to_dict() for entry in all_entries])
     
     # Check for specific errors
-    session_check = db_service.get_session_by_id(session_id)
+    session_check, player_check = db_service.get_session_and_player(session_id, player_id)
     if not session_check:
         return jsonify({"error": f"Session {session_id} not found."}), 404
     if not session_check.is_active:
         return jsonify({"error": f"Session {session_id} is not active."}), 400
-    player_check = db_service.get_player_by_id(player_id)
     if not player_check:
         return jsonify({"error": f"Player {player_id} not found."}), 404
     
-    return jsonify({"error": "Failed to remove buy-in. Player may not have any buy-ins in this session."}), 400
+    return error_response("Failed to remove buy-in. Player may not have any buy-ins in this session.", 400)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/<string:player_id>/set-buyins', methods=['PUT'])
+@validate_ids
 def set_buyins_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Set the buy-in count for a player in a session to an exact value.
@@ -363,20 +366,20 @@ def set_buyins_api(session_id: str, player_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with updated session entries or error message
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
 
     buy_in_count = data.get('buy_in_count')
     if buy_in_count is None:
-        return jsonify({"error": "buy_in_count is required"}), 400
+        return error_response("buy_in_count is required", 400)
 
     try:
         buy_in_count = int(buy_in_count)
         if buy_in_count < 1 or buy_in_count > 100:
-            return jsonify({"error": "buy_in_count must be between 1 and 100"}), 400
+            return error_response("buy_in_count must be between 1 and 100", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "buy_in_count must be an integer"}), 400
+        return error_response("buy_in_count must be an integer", 400)
 
     db_service = DatabaseService()
     result = db_service.set_buy_in_count(session_id, player_id, buy_in_count)
@@ -384,19 +387,19 @@ def set_buyins_api(session_id: str, player_id: str) -> Dict[str, Any]:
         all_entries = db_service.get_entries_for_session(session_id)
         return jsonify([entry.to_dict() for entry in all_entries])
 
-    session_check = db_service.get_session_by_id(session_id)
+    session_check, player_check = db_service.get_session_and_player(session_id, player_id)
     if not session_check:
         return jsonify({"error": f"Session {session_id} not found."}), 404
     if not session_check.is_active:
         return jsonify({"error": f"Session {session_id} is not active."}), 400
-    player_check = db_service.get_player_by_id(player_id)
     if not player_check:
         return jsonify({"error": f"Player {player_id} not found."}), 404
 
-    return jsonify({"error": "Failed to set buy-in count."}), 400
+    return error_response("Failed to set buy-in count.", 400)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/<string:player_id>/payout', methods=['PUT'])
+@validate_ids
 def record_payout_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Record a payout for a player in a session.
@@ -408,26 +411,20 @@ def record_payout_api(session_id: str, player_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with updated session entries or error message
     """
-    data = request.get_json()
+    data = get_json_body(max_size=MAX_JSON_BODY_SIZE)
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
     
     payout_amount_str = data.get('payout_amount')
     if payout_amount_str is None:
-        return jsonify({"error": "Payout amount is required"}), 400
-    
-    # Validate IDs
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
-    if not player_id or not isinstance(player_id, str):
-        return jsonify({"error": "Invalid player ID"}), 400
+        return error_response("Payout amount is required", 400)
     
     try:
         payout_amount = float(payout_amount_str)
         if payout_amount < 0 or payout_amount > 100000:
-            return jsonify({"error": "Payout amount must be between 0 and 100000"}), 400
+            return error_response("Payout amount must be between 0 and 100000", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "Invalid payout amount format"}), 400
+        return error_response("Invalid payout amount format", 400)
     
     db_service = DatabaseService()
     if db_service.record_payout(session_id, player_id, payout_amount):
@@ -435,14 +432,13 @@ def record_payout_api(session_id: str, player_id: str) -> Dict[str, Any]:
         return jsonify([entry.to_dict() for entry in all_entries])
     
     # Check for specific errors
-    entries = db_service.get_entries_for_session(session_id)
-    entry_check = any(e.player_id == player_id for e in entries)
-    if not entry_check:
+    if not db_service.entry_exists(session_id, player_id):
         return jsonify({"error": f"Player {player_id} not found in session {session_id}"}), 404
-    return jsonify({"error": "Failed to record payout for an unknown reason"}), 500
+    return error_response("Failed to record payout for an unknown reason", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/<string:player_id>/cash-out', methods=['PUT'])
+@validate_ids
 def toggle_cash_out_status_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Toggle the cash-out status for a player in a session.
@@ -454,20 +450,14 @@ def toggle_cash_out_status_api(session_id: str, player_id: str) -> Dict[str, Any
     Returns:
         JSON response with updated session entries or error message
     """
-    # Validate IDs
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
-    if not player_id or not isinstance(player_id, str):
-        return jsonify({"error": "Invalid player ID"}), 400
-    
     db_service = DatabaseService()
     
     # Check if session and player exist and session is active
     session = db_service.get_session_by_id(session_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
+        return error_response("Session not found", 404)
     if not session.is_active:
-        return jsonify({"error": "Session is not active"}), 400
+        return error_response("Session is not active", 400)
     
     # Toggle the cash-out status
     if db_service.toggle_player_cash_out_status(session_id, player_id):
@@ -475,14 +465,13 @@ def toggle_cash_out_status_api(session_id: str, player_id: str) -> Dict[str, Any
         return jsonify([entry.to_dict() for entry in all_entries])
     
     # Check if player entry exists
-    entries = db_service.get_entries_for_session(session_id)
-    entry_check = any(e.player_id == player_id for e in entries)
-    if not entry_check:
+    if not db_service.entry_exists(session_id, player_id):
         return jsonify({"error": f"Player {player_id} not found in session {session_id}"}), 404
-    return jsonify({"error": "Failed to toggle cash-out status for an unknown reason"}), 500
+    return error_response("Failed to toggle cash-out status for an unknown reason", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/entries/<string:player_id>/buy-in', methods=['POST'])
+@validate_ids
 def handle_buy_in_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Handle a buy-in for a player (sets cash-out status to False and records buy-in).
@@ -494,50 +483,41 @@ def handle_buy_in_api(session_id: str, player_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with updated session entries or error message
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
     
     num_buy_ins_str = data.get('num_buy_ins', "1")
     
-    # Validate IDs
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
-    if not player_id or not isinstance(player_id, str):
-        return jsonify({"error": "Invalid player ID"}), 400
-    
     try:
         num_buy_ins = int(num_buy_ins_str)
         if num_buy_ins <= 0 or num_buy_ins > 100:
-            return jsonify({"error": "Number of buy-ins must be between 1 and 100"}), 400
+            return error_response("Number of buy-ins must be between 1 and 100", 400)
     except (ValueError, TypeError):
-        return jsonify({"error": "Invalid number of buy-ins"}), 400
+        return error_response("Invalid number of buy-ins", 400)
     
     db_service = DatabaseService()
     
-    # Check if session exists and is active
-    session = db_service.get_session_by_id(session_id)
-    if not session:
-        return jsonify({"error": "Session not found"}), 404
-    if not session.is_active:
-        return jsonify({"error": "Session is not active"}), 400
-    
-    # Record the buy-in and set cash-out status to False
-    entry = db_service.record_player_entry(session_id, player_id, num_buy_ins)
+    # Record the buy-in and clear the cash-out status (they're buying back in)
+    # in a single commit
+    entry = db_service.record_player_entry(session_id, player_id, num_buy_ins, is_cashed_out=False)
     if entry:
-        # Set cash-out status to False since they're buying back in
-        if db_service.set_player_cash_out_status(session_id, player_id, False):
-            all_entries = db_service.get_entries_for_session(session_id)
-            return jsonify([entry.to_dict() for entry in all_entries]), 201
+        all_entries = db_service.get_entries_for_session(session_id)
+        return jsonify([entry.to_dict() for entry in all_entries]), 201
     
     # Check for specific errors
-    player_check = db_service.get_player_by_id(player_id)
+    session_check, player_check = db_service.get_session_and_player(session_id, player_id)
+    if not session_check:
+        return error_response("Session not found", 404)
+    if not session_check.is_active:
+        return error_response("Session is not active", 400)
     if not player_check:
         return jsonify({"error": f"Player {player_id} not found."}), 404
-    return jsonify({"error": "Failed to process buy-in for an unknown reason"}), 500
+    return error_response("Failed to process buy-in for an unknown reason", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/players/<string:player_id>/seven-two-wins/increment', methods=['PUT'])
+@validate_ids
 def increment_session_seven_two_wins_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Increment session-specific 7-2 wins for a player.
@@ -549,32 +529,28 @@ def increment_session_seven_two_wins_api(session_id: str, player_id: str) -> Dic
     Returns:
         JSON response with updated session entries or error message
     """
-    if not session_id or not player_id:
-        return jsonify({"error": "Session ID and Player ID are required"}), 400
-    
     db_service = DatabaseService()
     
     # Check if session and player exist
-    session = db_service.get_session_by_id(session_id)
+    session, player = db_service.get_session_and_player(session_id, player_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
-    
-    player = db_service.get_player_by_id(player_id)
+        return error_response("Session not found", 404)
     if not player:
-        return jsonify({"error": "Player not found"}), 404
+        return error_response("Player not found", 404)
     
     try:
         if db_service.increment_session_seven_two_wins(session_id, player_id):
             # Return updated session entries
             updated_entries = db_service.get_entries_for_session(session_id)
             return jsonify([entry.to_dict() for entry in updated_entries])
-        return jsonify({"error": "Failed to increment session 7-2 wins count"}), 500
+        return error_response("Failed to increment session 7-2 wins count", 500)
     except Exception as e:
-        logger.error(f"Error incrementing session 7-2 wins for player {player_id} in session {session_id}: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error incrementing session 7-2 wins for player %s in session %s: %s", player_id, session_id, e)
+        return error_response("Internal server error", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/players/<string:player_id>/seven-two-wins/decrement', methods=['PUT'])
+@validate_ids
 def decrement_session_seven_two_wins_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Decrement session-specific 7-2 wins for a player.
@@ -586,32 +562,28 @@ def decrement_session_seven_two_wins_api(session_id: str, player_id: str) -> Dic
     Returns:
         JSON response with updated session entries or error message
     """
-    if not session_id or not player_id:
-        return jsonify({"error": "Session ID and Player ID are required"}), 400
-    
     db_service = DatabaseService()
     
     # Check if session and player exist
-    session = db_service.get_session_by_id(session_id)
+    session, player = db_service.get_session_and_player(session_id, player_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
-    
-    player = db_service.get_player_by_id(player_id)
+        return error_response("Session not found", 404)
     if not player:
-        return jsonify({"error": "Player not found"}), 404
+        return error_response("Player not found", 404)
     
     try:
         if db_service.decrement_session_seven_two_wins(session_id, player_id):
             # Return updated session entries
             updated_entries = db_service.get_entries_for_session(session_id)
             return jsonify([entry.to_dict() for entry in updated_entries])
-        return jsonify({"error": "Failed to decrement session 7-2 wins count"}), 500
+        return error_response("Failed to decrement session 7-2 wins count", 500)
     except Exception as e:
-        logger.error(f"Error decrementing session 7-2 wins for player {player_id} in session {session_id}: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error decrementing session 7-2 wins for player %s in session %s: %s", player_id, session_id, e)
+        return error_response("Internal server error", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/players/<string:player_id>/strikes/increment', methods=['PUT'])
+@validate_ids
 def increment_session_strikes_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Increment session-specific strikes for a player.
@@ -623,32 +595,28 @@ def increment_session_strikes_api(session_id: str, player_id: str) -> Dict[str,
     Returns:
         JSON response with updated session entries or error message
     """
-    if not session_id or not player_id:
-        return jsonify({"error": "Session ID and Player ID are required"}), 400
-    
     db_service = DatabaseService()
     
     # Check if session and player exist
-    session = db_service.get_session_by_id(session_id)
+    session, player = db_service.get_session_and_player(session_id, player_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
-    
-    player = db_service.get_player_by_id(player_id)
+        return error_response("Session not found", 404)
     if not player:
-        return jsonify({"error": "Player not found"}), 404
+        return error_response("Player not found", 404)
     
     try:
         if db_service.increment_session_strikes(session_id, player_id):
             # Return updated session entries
             updated_entries = db_service.get_entries_for_session(session_id)
             return jsonify([entry.to_dict() for entry in updated_entries])
-        return jsonify({"error": "Failed to increment session strikes count"}), 500
+        return error_response("Failed to increment session strikes count", 500)
     except Exception as e:
-        logger.error(f"Error incrementing session strikes for player {player_id} in session {session_id}: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error incrementing session strikes for player %s in session %s: %s", player_id, session_id, e)
+        return error_response("Internal server error", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/players/<string:player_id>/strikes/decrement', methods=['PUT'])
+@validate_ids
 def decrement_session_strikes_api(session_id: str, player_id: str) -> Dict[str, Any]:
     """
     Decrement session-specific strikes for a player.
@@ -660,32 +628,28 @@ def decrement_session_strikes_api(session_id: str, player_id: str) -> Dict[str,
     Returns:
         JSON response with updated session entries or error message
     """
-    if not session_id or not player_id:
-        return jsonify({"error": "Session ID and Player ID are required"}), 400
-
     db_service = DatabaseService()
 
     # Check if session and player exist
-    session = db_service.get_session_by_id(session_id)
+    session, player = db_service.get_session_and_player(session_id, player_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
-
-    player = db_service.get_player_by_id(player_id)
+        return error_response("Session not found", 404)
     if not player:
-        return jsonify({"error": "Player not found"}), 404
+        return error_response("Player not found", 404)
 
     try:
         if db_service.decrement_session_strikes(session_id, player_id):
             # Return updated session entries
             updated_entries = db_service.get_entries_for_session(session_id)
             return jsonify([entry.to_dict() for entry in updated_entries])
-        return jsonify({"error": "Failed to decrement session strikes count"}), 500
+        return error_response("Failed to decrement session strikes count", 500)
     except Exception as e:
-        logger.error(f"Error decrementing session strikes for player {player_id} in session {session_id}: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error decrementing session strikes for player %s in session %s: %s", player_id, session_id, e)
+        return error_response("Internal server error", 500)
 
 
 @sessions_bp.route('/sessions/<string:session_id>/wisdom', methods=['PUT'])
+@validate_ids
 def set_session_wisdom_api(session_id: str) -> Dict[str, Any]:
     """
     Set the Words of Wisdom quote for a session.
@@ -696,29 +660,25 @@ def set_session_wisdom_api(session_id: str) -> Dict[str, Any]:
     Returns:
         JSON response with updated session or error message
     """
-    data = request.get_json()
+    data = get_json_body()
     if not data:
-        return jsonify({"error": "Request body is required"}), 400
+        return error_response("Request body is required", 400)
 
     wisdom_quote = data.get('wisdom_quote', '').strip()
     wisdom_player_id = data.get('wisdom_player_id')
 
-    # Validate session_id
-    if not session_id or not isinstance(session_id, str):
-        return jsonify({"error": "Invalid session ID"}), 400
-
     db_service = DatabaseService()
 
     # Check if session exists
     session = db_service.get_session_by_id(session_id)
     if not session:
-        return jsonify({"error": "Session not found"}), 404
+        return error_response("Session not found", 404)
 
     # If player_id is provided, validate it exists
     if wisdom_player_id:
         player = db_service.get_player_by_id(wisdom_player_id)
         if not player:
-            return jsonify({"error": "Player not found"}), 404
+            return error_response("Player not found", 404)
 
     try:
         # Update session with wisdom quote
@@ -729,5 +689,5 @@ def set_session_wisdom_api(session_id: str) -> Dict[str, Any]:
 
         return jsonify(session.to_dict())
     except Exception as e:
-        logger.error(f"Error setting wisdom quote for session {session_id}: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+        logger.error("Error setting wisdom quote for session %s: %s", session_id, e)
+        return error_response("Internal server error", 500)
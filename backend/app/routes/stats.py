@@ -1,17 +1,19 @@
 # Stats API endpoints
 from flask import Blueprint, jsonify
 from app.services.database_service import DatabaseService
+from app.utils.cache import cached_response
 from datetime import datetime
 
 stats_bp = Blueprint('stats', __name__)
 database_service = DatabaseService()
 
 @stats_bp.route('/api/stats/summary', methods=['GET'])
+@cached_response()
 def get_stats_summary():
     """Get overall statistics summary"""
     try:
         # Get all sessions for calculations
-        sessions = database_service.get_all_sessions()
+        sessions = database_service.get_all_sessions_with_entries()
         
         if not sessions:
             return jsonify({
@@ -29,7 +31,7 @@ def get_stats_summary():
         all_players = set()
         
         for session in sessions:
-            entries = database_service.get_entries_for_session(session.session_id)
+            entries = session.entries
             for entry in entries:
                 # Add up buy-ins and payouts from entry data
                 total_buy_ins += entry.total_buy_in_amount or 0
@@ -54,11 +56,12 @@ def get_stats_summary():
         return jsonify({'error': str(e)}), 500
 
 @stats_bp.route('/api/stats/leaderboards', methods=['GET'])
+@cached_response()
 def get_leaderboard_stats():
     """Get leaderboard statistics"""
     try:
         # Get all sessions and entries for calculations
-        sessions = database_service.get_all_sessions()
+        sessions = database_service.get_all_sessions_with_entries()
         
         if not sessions:
             return jsonify({
@@ -77,7 +80,7 @@ def get_leaderboard_stats():
         player_stats = {}
         
         for session in sessions:
-            entries = database_service.get_entries_for_session(session.session_id)
+            entries = session.entries
             for entry in entries:
                 player_id = entry.player_id
                 profit = entry.profit or 0
@@ -201,7 +204,7 @@ def get_leaderboard_stats():
         player_advanced_stats = {}
         
         for session in sessions:
-            entries = database_service.get_entries_for_session(session.session_id)
+            entries = session.entries
             for entry in entries:
                 player_id = entry.player_id
                 player_name = entry.player.name if entry.player else 'Unknown'
@@ -376,11 +379,12 @@ def get_leaderboard_stats():
         return jsonify({'error': str(e)}), 500
 
 @stats_bp.route('/api/stats/gambling-over-time', methods=['GET'])
+@cached_response()
 def get_gambling_over_time():
     """Get gambling data over time for chart visualization"""
     try:
         # Get all sessions ordered by date
-        sessions = database_service.get_all_sessions()
+        sessions = database_service.get_all_sessions_with_entries()
         
         if not sessions:
             return jsonify({
@@ -398,7 +402,7 @@ def get_gambling_over_time():
         
         for session in sorted_sessions:
             # Calculate session buy-ins from entries
-            entries = database_service.get_entries_for_session(session.session_id)
+            entries = session.entries
             session_buy_ins = sum(entry.total_buy_in_amount or 0 for entry in entries)
             cumulative_amount += session_buy_ins
             
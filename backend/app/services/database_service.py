@@ -5,11 +5,13 @@ This module handles all database operations using SQLAlchemy ORM.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import desc
+from sqlalchemy import desc, true
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 
-from ..database.models import db, Player, Session, Entry, CalendarEvent, EventRSVP, round_to_cents
+from ..database.models import db, Player, Session, Entry, CalendarEvent, EventRSVP, round_to_cents, _json_dumps
 from ..models import PlayerStats, PlayerSessionHistory
 
 logger = logging.getLogger(__name__)
@@ -18,7 +20,7 @@ logger = logging.getLogger(__name__)
 try:
     from .notification_service import NotificationService
 except ImportError as e:
-    logger.warning(f"Could not import NotificationService: {e}")
+    logger.warning("Could not import NotificationService: %s", e)
     NotificationService = None
 
 
@@ -52,7 +54,7 @@ class DatabaseService:
             ).first()
             
             if existing_player:
-                self.logger.info(f"Player '{name}' already exists.")
+                self.logger.info("Player '%s' already exists.", name)
                 return existing_player
             
             # Generate new player ID based on existing player_ids
@@ -79,12 +81,12 @@ class DatabaseService:
             db.session.add(new_player)
             db.session.commit()
             
-            self.logger.info(f"Player '{name}' added with ID {player_id}")
+            self.logger.info("Player '%s' added with ID %s", name, player_id)
             return new_player
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to add player '{name}': {str(e)}")
+            self.logger.error("Failed to add player '%s': %s", name, e)
             return None
     
     def get_player_by_id(self, player_id: str) -> Optional[Player]:
@@ -122,7 +124,7 @@ class DatabaseService:
         """
         return Player.query.order_by(Player.name).all()
     
-    def increment_seven_two_wins(self, player_id: str) -> bool:
+    def increment_seven_two_wins(self, player_id: str) -> Optional[Player]:
         """
         Increment the counter for a player winning with a 7-2 hand.
         
@@ -130,26 +132,26 @@ class DatabaseService:
             player_id: Player's unique identifier
             
         Returns:
-            True if successful, False otherwise
+            Updated Player instance if successful, None otherwise
         """
         try:
             player = self.get_player_by_id(player_id)
             if not player:
-                self.logger.error(f"Player {player_id} not found to update 7-2 wins.")
-                return False
+                self.logger.error("Player %s not found to update 7-2 wins.", player_id)
+                return None
             
             player.seven_two_wins += 1
             db.session.commit()
             
-            self.logger.info(f"Player {player.name} now has {player.seven_two_wins} wins with 7-2 hands.")
-            return True
+            self.logger.info("Player %s now has %s wins with 7-2 hands.", player.name, player.seven_two_wins)
+            return player
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to increment 7-2 wins for player {player_id}: {str(e)}")
-            return False
+            self.logger.error("Failed to increment 7-2 wins for player %s: %s", player_id, e)
+            return None
     
-    def decrement_seven_two_wins(self, player_id: str) -> bool:
+    def decrement_seven_two_wins(self, player_id: str) -> Optional[Player]:
         """
         Decrement the counter for a player winning with a 7-2 hand.
         
@@ -157,43 +159,46 @@ class DatabaseService:
             player_id: Player's unique identifier
             
         Returns:
-            True if successful, False otherwise
+            Updated Player instance if successful, None otherwise
         """
         try:
             player = self.get_player_by_id(player_id)
             if not player:
-                self.logger.error(f"Player {player_id} not found to update 7-2 wins.")
-                return False
+                self.logger.error("Player %s not found to update 7-2 wins.", player_id)
+                return None
             
             if player.seven_two_wins > 0:
                 player.seven_two_wins -= 1
                 db.session.commit()
-                self.logger.info(f"Player {player.name} now has {player.seven_two_wins} wins with 7-2 hands.")
+                self.logger.info("Player %s now has %s wins with 7-2 hands.", player.name, player.seven_two_wins)
             else:
-                self.logger.warning(f"Player {player.name} already has 0 wins with 7-2 hands, cannot decrement.")
+                self.logger.warning("Player %s already has 0 wins with 7-2 hands, cannot decrement.", player.name)
             
-            return True
+            return player
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to decrement 7-2 wins for player {player_id}: {str(e)}")
-            return False
+            self.logger.error("Failed to decrement 7-2 wins for player %s: %s", player_id, e)
+            return None
     
     # Session operations
-    def create_session(self, date_str: str, default_buy_in_value: float = 20.00) -> Optional[Session]:
+    def create_session(self, date_str: str, default_buy_in_value: float = 20.00,
+                       chip_distribution: Optional[Dict[str, int]] = None,
+                       total_chips: Optional[int] = None) -> Optional[Session]:
         """
         Create a new session.
         
         Args:
             date_str: Session date in YYYY-MM-DD format
             default_buy_in_value: Default buy-in amount for the session
+            chip_distribution: Chip counts per color, stored with the session
+            total_chips: Total of chip_distribution, if the caller already has it
             
         Returns:
             Session instance if successful, None otherwise
         """
         try:
             # Validate date format
-            from datetime import datetime
             datetime.strptime(date_str, "%Y-%m-%d")
             
             # Generate session ID
@@ -207,11 +212,16 @@ class DatabaseService:
                 is_active=True,
                 status="ACTIVE"
             )
+            if chip_distribution:
+                new_session.chip_distribution = _json_dumps(chip_distribution)
+                new_session.total_chips = (
+                    total_chips if total_chips is not None else sum(chip_distribution.values())
+                )
             
             db.session.add(new_session)
             db.session.commit()
             
-            self.logger.info(f"Session created for {date_str} with ID {session_id}, Buy-in: ${default_buy_in_value:.2f}")
+            self.logger.info("Session created for %s with ID %s, Buy-in: $%.2f", date_str, session_id, default_buy_in_value)
             return new_session
             
         except ValueError:
@@ -219,7 +229,7 @@ class DatabaseService:
             return None
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to create session: {str(e)}")
+            self.logger.error("Failed to create session: %s", e)
             return None
     
     def get_session_by_id(self, session_id: str) -> Optional[Session]:
@@ -234,6 +244,44 @@ class DatabaseService:
         """
         return Session.query.filter_by(session_id=session_id).first()
     
+    def get_session_with_entries(self, session_id: str) -> Optional[Session]:
+        """
+        Get a session with its entries and their players already loaded.
+        
+        Args:
+            session_id: Session's unique identifier
+            
+        Returns:
+            Session instance if found (with session.entries populated), None otherwise
+        """
+        return Session.query.options(
+            selectinload(Session.entries).joinedload(Entry.player)
+        ).filter_by(session_id=session_id).first()
+    
+    def get_session_and_player(self, session_id: str, player_id: str) -> Tuple[Optional[Session], Optional[Player]]:
+        """
+        Get a session and a player together in a single query.
+        
+        Only when one of them is missing are they looked up separately, so
+        callers can still tell which one was not found.
+        
+        Args:
+            session_id: Session's unique identifier
+            player_id: Player's unique identifier
+            
+        Returns:
+            Tuple of (Session or None, Player or None)
+        """
+        # Each side matches at most one row by its unique ID, so the explicit
+        # cross join yields a single (session, player) row
+        row = db.session.query(Session).join(Player, true()).filter(
+            Session.session_id == session_id,
+            Player.player_id == player_id
+        ).add_entity(Player).first()
+        if row:
+            return row[0], row[1]
+        return self.get_session_by_id(session_id), self.get_player_by_id(player_id)
+    
     def get_active_sessions(self) -> List[Session]:
         """
         Get all active sessions.
@@ -252,6 +300,31 @@ class DatabaseService:
         """
         return Session.query.order_by(desc(Session.date)).all()
     
+    def get_session_buy_in_totals(self) -> Dict[str, float]:
+        """
+        Get the total buy-in amount of every session that has entries.
+        
+        Lets session lists be serialized without loading each session's entries.
+        
+        Returns:
+            Dictionary mapping session_id to the sum of its entries' buy-ins
+        """
+        rows = db.session.query(
+            Entry.session_id, db.func.sum(Entry.total_buy_in_amount)
+        ).group_by(Entry.session_id).all()
+        return {session_id: total or 0.0 for session_id, total in rows}
+    
+    def get_all_sessions_with_entries(self) -> List[Session]:
+        """
+        Get all sessions with their entries and the entries' players already loaded.
+        
+        Returns:
+            List of all Session instances, sorted by date (newest first)
+        """
+        return Session.query.options(
+            selectinload(Session.entries).joinedload(Entry.player)
+        ).order_by(desc(Session.date)).all()
+    
     def end_session(self, session_id: str) -> bool:
         """
         Mark a session as no longer active.
@@ -265,23 +338,23 @@ class DatabaseService:
         try:
             session = self.get_session_by_id(session_id)
             if not session:
-                self.logger.error(f"Session {session_id} not found to end.")
+                self.logger.error("Session %s not found to end.", session_id)
                 return False
             
             session.is_active = False
             session.status = 'ENDED'
             db.session.commit()
             
-            self.logger.info(f"Session {session_id} has been ended.")
+            self.logger.info("Session %s has been ended.", session_id)
             
             # Send push notifications to subscribers
             if NotificationService:
                 try:
                     notification_service = NotificationService()
                     notification_result = notification_service.send_session_end_notifications(session_id)
-                    self.logger.info(f"Notification result for session {session_id}: {notification_result}")
+                    self.logger.info("Notification result for session %s: %s", session_id, notification_result)
                 except Exception as e:
-                    self.logger.error(f"Failed to send notifications for session {session_id}: {str(e)}")
+                    self.logger.error("Failed to send notifications for session %s: %s", session_id, e)
                     # Don't fail the session ending if notifications fail
             else:
                 self.logger.warning("NotificationService not available, skipping notifications")
@@ -290,7 +363,7 @@ class DatabaseService:
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to end session {session_id}: {str(e)}")
+            self.logger.error("Failed to end session %s: %s", session_id, e)
             return False
     
     def reactivate_session(self, session_id: str) -> bool:
@@ -306,19 +379,19 @@ class DatabaseService:
         try:
             session = self.get_session_by_id(session_id)
             if not session:
-                self.logger.error(f"Session {session_id} not found to reactivate.")
+                self.logger.error("Session %s not found to reactivate.", session_id)
                 return False
             
             session.is_active = True
             session.status = 'ACTIVE'
             db.session.commit()
             
-            self.logger.info(f"Session {session_id} has been reactivated.")
+            self.logger.info("Session %s has been reactivated.", session_id)
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to reactivate session {session_id}: {str(e)}")
+            self.logger.error("Failed to reactivate session %s: %s", session_id, e)
             return False
     
     def update_session(self, session_id: str, updated_session: Session) -> bool:
@@ -335,7 +408,7 @@ class DatabaseService:
         try:
             session = self.get_session_by_id(session_id)
             if not session:
-                self.logger.error(f"Session {session_id} not found to update.")
+                self.logger.error("Session %s not found to update.", session_id)
                 return False
             
             # Update fields
@@ -347,16 +420,17 @@ class DatabaseService:
             
             db.session.commit()
             
-            self.logger.info(f"Session {session_id} has been updated with new data.")
+            self.logger.info("Session %s has been updated with new data.", session_id)
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to update session {session_id}: {str(e)}")
+            self.logger.error("Failed to update session %s: %s", session_id, e)
             return False
     
     # Entry operations
-    def record_player_entry(self, session_id: str, player_id: str, num_buy_ins: int = 1) -> Optional[Entry]:
+    def record_player_entry(self, session_id: str, player_id: str, num_buy_ins: int = 1,
+                            is_cashed_out: Optional[bool] = None) -> Optional[Entry]:
         """
         Record initial buy-ins or re-buys for a player in a session.
         
@@ -364,25 +438,25 @@ class DatabaseService:
             session_id: Session's unique identifier
             player_id: Player's unique identifier
             num_buy_ins: Number of buy-ins to record
+            is_cashed_out: Cash-out status to set in the same commit, if given
             
         Returns:
             Entry instance if successful, None otherwise
         """
         try:
             # Check if session and player exist
-            session = self.get_session_by_id(session_id)
-            player = self.get_player_by_id(player_id)
+            session, player = self.get_session_and_player(session_id, player_id)
             
             if not session:
-                self.logger.error(f"Session {session_id} not found.")
+                self.logger.error("Session %s not found.", session_id)
                 return None
             if not player:
-                self.logger.error(f"Player {player_id} not found.")
+                self.logger.error("Player %s not found.", player_id)
                 return None
             
             # Check if session is still active
             if not session.is_active:
-                self.logger.error(f"Cannot record entry for session {session_id} because it has ended.")
+                self.logger.error("Cannot record entry for session %s because it has ended.", session_id)
                 return None
             
             # Check if player is already in the session
@@ -399,12 +473,14 @@ class DatabaseService:
                 existing_entry.buy_in_count += num_buy_ins
                 existing_entry.total_buy_in_amount = round_to_cents(existing_entry.buy_in_count * cost_per_buy_in)
                 existing_entry.calculate_profit()
+                if is_cashed_out is not None:
+                    existing_entry.is_cashed_out = is_cashed_out
                 
                 db.session.commit()
                 
                 self.logger.info(
-                    f"{player.name} added {num_buy_ins} buy-in(s) to session {session_id}. "
-                    f"New total buy-ins: {existing_entry.buy_in_count}"
+                    "%s added %s buy-in(s) to session %s. New total buy-ins: %s",
+                    player.name, num_buy_ins, session_id, existing_entry.buy_in_count
                 )
                 return existing_entry
             else:
@@ -432,16 +508,18 @@ class DatabaseService:
                     profit=round_to_cents(-total_buy_in_for_this_action),
                     session_seven_two_wins=0
                 )
+                if is_cashed_out is not None:
+                    new_entry.is_cashed_out = is_cashed_out
                 
                 db.session.add(new_entry)
                 db.session.commit()
                 
-                self.logger.info(f"{player.name} joined session {session_id} with {num_buy_ins} buy-in(s).")
+                self.logger.info("%s joined session %s with %s buy-in(s).", player.name, session_id, num_buy_ins)
                 return new_entry
                 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to record player entry: {str(e)}")
+            self.logger.error("Failed to record player entry: %s", e)
             return None
 
     def add_players_to_session_bulk(self, session_id: str, player_ids: List[str], num_buy_ins: int = 1) -> Optional[List[Entry]]:
@@ -459,17 +537,17 @@ class DatabaseService:
         try:
             session = self.get_session_by_id(session_id)
             if not session:
-                self.logger.error(f"Session {session_id} not found.")
+                self.logger.error("Session %s not found.", session_id)
                 return None
 
             if not session.is_active:
-                self.logger.error(f"Cannot add players to session {session_id} because it has ended.")
+                self.logger.error("Cannot add players to session %s because it has ended.", session_id)
                 return None
 
             unique_player_ids = list(dict.fromkeys(player_ids))
             players = Player.query.filter(Player.player_id.in_(unique_player_ids)).all()
             if len(players) != len(unique_player_ids):
-                self.logger.error(f"One or more players were not found for bulk add into session {session_id}.")
+                self.logger.error("One or more players were not found for bulk add into session %s.", session_id)
                 return None
 
             existing_entries = Entry.query.filter(
@@ -477,7 +555,7 @@ class DatabaseService:
                 Entry.player_id.in_(unique_player_ids)
             ).all()
             if existing_entries:
-                self.logger.error(f"One or more players already exist in session {session_id}.")
+                self.logger.error("One or more players already exist in session %s.", session_id)
                 return None
 
             cost_per_buy_in = session.default_buy_in_value
@@ -519,13 +597,13 @@ class DatabaseService:
 
             created_names = ', '.join(player_lookup[player_id].name for player_id in unique_player_ids)
             self.logger.info(
-                f"Added {len(created_entries)} players to session {session_id}: {created_names}"
+                "Added %s players to session %s: %s", len(created_entries), session_id, created_names
             )
             return created_entries
 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to bulk add players to session: {str(e)}")
+            self.logger.error("Failed to bulk add players to session: %s", e)
             return None
     
     def remove_buy_in(self, session_id: str, player_id: str) -> Optional[Entry]:
@@ -541,19 +619,18 @@ class DatabaseService:
         """
         try:
             # Check if session and player exist
-            session = self.get_session_by_id(session_id)
-            player = self.get_player_by_id(player_id)
+            session, player = self.get_session_and_player(session_id, player_id)
             
             if not session:
-                self.logger.error(f"Session {session_id} not found.")
+                self.logger.error("Session %s not found.", session_id)
                 return None
             if not player:
-                self.logger.error(f"Player {player_id} not found.")
+                self.logger.error("Player %s not found.", player_id)
                 return None
             
             # Check if session is still active
             if not session.is_active:
-                self.logger.error(f"Cannot modify entry for session {session_id} because it has ended.")
+                self.logger.error("Cannot modify entry for session %s because it has ended.", session_id)
                 return None
             
             # Find the player's entry
@@ -563,7 +640,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.warning(f"Player {player.name} not found in session {session_id}.")
+                self.logger.warning("Player %s not found in session %s.", player.name, session_id)
                 return None
             
             cost_per_buy_in = session.default_buy_in_value
@@ -577,8 +654,8 @@ class DatabaseService:
                 db.session.commit()
                 
                 self.logger.info(
-                    f"Removed one buy-in from {player.name} in session {session_id}. "
-                    f"New total: {entry.buy_in_count}"
+                    "Removed one buy-in from %s in session %s. New total: %s",
+                    player.name, session_id, entry.buy_in_count
                 )
                 return entry
             else:
@@ -587,14 +664,14 @@ class DatabaseService:
                 db.session.commit()
                 
                 self.logger.info(
-                    f"Removed last buy-in for {player.name} from session {session_id}. "
-                    f"Player removed from session."
+                    "Removed last buy-in for %s from session %s. Player removed from session.",
+                    player.name, session_id
                 )
                 return None
                 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to remove buy-in: {str(e)}")
+            self.logger.error("Failed to remove buy-in: %s", e)
             return None
     
     def set_buy_in_count(self, session_id: str, player_id: str, buy_in_count: int) -> Optional[Entry]:
@@ -610,18 +687,17 @@ class DatabaseService:
             Updated Entry instance if successful, None otherwise
         """
         try:
-            session = self.get_session_by_id(session_id)
-            player = self.get_player_by_id(player_id)
+            session, player = self.get_session_and_player(session_id, player_id)
 
             if not session:
-                self.logger.error(f"Session {session_id} not found.")
+                self.logger.error("Session %s not found.", session_id)
                 return None
             if not player:
-                self.logger.error(f"Player {player_id} not found.")
+                self.logger.error("Player %s not found.", player_id)
                 return None
 
             if not session.is_active:
-                self.logger.error(f"Cannot modify entry for session {session_id} because it has ended.")
+                self.logger.error("Cannot modify entry for session %s because it has ended.", session_id)
                 return None
 
             entry = Entry.query.filter_by(
@@ -630,7 +706,7 @@ class DatabaseService:
             ).first()
 
             if not entry:
-                self.logger.warning(f"Player {player.name} not found in session {session_id}.")
+                self.logger.warning("Player %s not found in session %s.", player.name, session_id)
                 return None
 
             cost_per_buy_in = session.default_buy_in_value
@@ -641,14 +717,14 @@ class DatabaseService:
             db.session.commit()
 
             self.logger.info(
-                f"Set buy-in count for {player.name} in session {session_id} to {buy_in_count}. "
-                f"New total: ${entry.total_buy_in_amount:.2f}"
+                "Set buy-in count for %s in session %s to %s. New total: $%.2f",
+                player.name, session_id, buy_in_count, entry.total_buy_in_amount
             )
             return entry
 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to set buy-in count: {str(e)}")
+            self.logger.error("Failed to set buy-in count: %s", e)
             return None
 
     def record_payout(self, session_id: str, player_id: str, payout_amount: float) -> bool:
@@ -670,7 +746,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"No entry found for player {player_id} in session {session_id} to record payout.")
+                self.logger.error("No entry found for player %s in session %s to record payout.", player_id, session_id)
                 return False
             
             entry.payout = round_to_cents(float(payout_amount))
@@ -682,14 +758,14 @@ class DatabaseService:
             player_name = player.name if player else player_id
             
             self.logger.info(
-                f"Payout for {player_name} in session {session_id} recorded as "
-                f"${payout_amount:.2f}. Profit: ${entry.profit:.2f}"
+                "Payout for %s in session %s recorded as $%.2f. Profit: $%.2f",
+                player_name, session_id, payout_amount, entry.profit
             )
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to record payout: {str(e)}")
+            self.logger.error("Failed to record payout: %s", e)
             return False
     
     def set_player_cash_out_status(self, session_id: str, player_id: str, is_cashed_out: bool) -> bool:
@@ -711,7 +787,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"No entry found for player {player_id} in session {session_id} to update cash-out status.")
+                self.logger.error("No entry found for player %s in session %s to update cash-out status.", player_id, session_id)
                 return False
             
             entry.is_cashed_out = is_cashed_out
@@ -721,12 +797,12 @@ class DatabaseService:
             player_name = player.name if player else player_id
             status = "cashed out" if is_cashed_out else "active"
             
-            self.logger.info(f"Player {player_name} in session {session_id} marked as {status}")
+            self.logger.info("Player %s in session %s marked as %s", player_name, session_id, status)
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to set cash-out status: {str(e)}")
+            self.logger.error("Failed to set cash-out status: %s", e)
             return False
     
     def toggle_player_cash_out_status(self, session_id: str, player_id: str) -> bool:
@@ -747,7 +823,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"No entry found for player {player_id} in session {session_id} to toggle cash-out status.")
+                self.logger.error("No entry found for player %s in session %s to toggle cash-out status.", player_id, session_id)
                 return False
             
             # Toggle the status
@@ -758,12 +834,12 @@ class DatabaseService:
             player_name = player.name if player else player_id
             status = "cashed out" if entry.is_cashed_out else "active"
             
-            self.logger.info(f"Player {player_name} in session {session_id} toggled to {status}")
+            self.logger.info("Player %s in session %s toggled to %s", player_name, session_id, status)
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to toggle cash-out status: {str(e)}")
+            self.logger.error("Failed to toggle cash-out status: %s", e)
             return False
     
     def get_entries_for_session(self, session_id: str) -> List[Entry]:
@@ -776,7 +852,26 @@ class DatabaseService:
         Returns:
             List of Entry instances for the session
         """
-        return Entry.query.filter_by(session_id=session_id).join(Player).all()
+        return Entry.query.filter_by(session_id=session_id).join(Player).options(
+            contains_eager(Entry.player)
+        ).all()
+    
+    def entry_exists(self, session_id: str, player_id: str) -> bool:
+        """
+        Check whether a player has an entry in a session.
+        
+        Runs an EXISTS query, so no Entry row is loaded.
+        
+        Args:
+            session_id: Session's unique identifier
+            player_id: Player's unique identifier
+            
+        Returns:
+            True if the player is in the session, False otherwise
+        """
+        return db.session.query(
+            Entry.query.filter_by(session_id=session_id, player_id=player_id).exists()
+        ).scalar()
     
     def increment_session_seven_two_wins(self, session_id: str, player_id: str) -> bool:
         """
@@ -796,21 +891,21 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"Player {player_id} not found in session {session_id} to update session 7-2 wins.")
+                self.logger.error("Player %s not found in session %s to update session 7-2 wins.", player_id, session_id)
                 return False
             
             entry.session_seven_two_wins += 1
             db.session.commit()
             
             self.logger.info(
-                f"Player {entry.player.name} now has {entry.session_seven_two_wins} "
-                f"7-2 wins in session {session_id}."
+                "Player %s now has %s 7-2 wins in session %s.",
+                entry.player.name, entry.session_seven_two_wins, session_id
             )
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to increment session 7-2 wins: {str(e)}")
+            self.logger.error("Failed to increment session 7-2 wins: %s", e)
             return False
     
     def decrement_session_seven_two_wins(self, session_id: str, player_id: str) -> bool:
@@ -831,7 +926,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"Player {player_id} not found in session {session_id} to update session 7-2 wins.")
+                self.logger.error("Player %s not found in session %s to update session 7-2 wins.", player_id, session_id)
                 return False
             
             if entry.session_seven_two_wins > 0:
@@ -839,20 +934,20 @@ class DatabaseService:
                 db.session.commit()
                 
                 self.logger.info(
-                    f"Player {entry.player.name} now has {entry.session_seven_two_wins} "
-                    f"7-2 wins in session {session_id}."
+                    "Player %s now has %s 7-2 wins in session %s.",
+                    entry.player.name, entry.session_seven_two_wins, session_id
                 )
             else:
                 self.logger.warning(
-                    f"Player {entry.player.name} already has 0 session 7-2 wins "
-                    f"in session {session_id}, cannot decrement."
+                    "Player %s already has 0 session 7-2 wins in session %s, cannot decrement.",
+                    entry.player.name, session_id
                 )
             
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to decrement session 7-2 wins: {str(e)}")
+            self.logger.error("Failed to decrement session 7-2 wins: %s", e)
             return False
     
     def increment_session_strikes(self, session_id: str, player_id: str) -> bool:
@@ -873,21 +968,21 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"Player {player_id} not found in session {session_id} to update session strikes.")
+                self.logger.error("Player %s not found in session %s to update session strikes.", player_id, session_id)
                 return False
             
             entry.session_strikes += 1
             db.session.commit()
             
             self.logger.info(
-                f"Player {entry.player.name} now has {entry.session_strikes} "
-                f"strikes in session {session_id}."
+                "Player %s now has %s strikes in session %s.",
+                entry.player.name, entry.session_strikes, session_id
             )
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to increment session strikes: {str(e)}")
+            self.logger.error("Failed to increment session strikes: %s", e)
             return False
     
     def decrement_session_strikes(self, session_id: str, player_id: str) -> bool:
@@ -908,7 +1003,7 @@ class DatabaseService:
             ).first()
             
             if not entry:
-                self.logger.error(f"Player {player_id} not found in session {session_id} to update session strikes.")
+                self.logger.error("Player %s not found in session %s to update session strikes.", player_id, session_id)
                 return False
             
             if entry.session_strikes > 0:
@@ -916,20 +1011,20 @@ class DatabaseService:
                 db.session.commit()
                 
                 self.logger.info(
-                    f"Player {entry.player.name} now has {entry.session_strikes} "
-                    f"strikes in session {session_id}."
+                    "Player %s now has %s strikes in session %s.",
+                    entry.player.name, entry.session_strikes, session_id
                 )
             else:
                 self.logger.warning(
-                    f"Player {entry.player.name} already has 0 session strikes "
-                    f"in session {session_id}, cannot decrement."
+                    "Player %s already has 0 session strikes in session %s, cannot decrement.",
+                    entry.player.name, session_id
                 )
             
             return True
             
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to decrement session strikes: {str(e)}")
+            self.logger.error("Failed to decrement session strikes: %s", e)
             return False
     
     def get_player_session_history(self, player_id: str) -> List[PlayerSessionHistory]:
@@ -942,7 +1037,9 @@ class DatabaseService:
         Returns:
             List of PlayerSessionHistory instances, sorted by date (newest first)
         """
-        entries = Entry.query.filter_by(player_id=player_id).join(Session).order_by(desc(Session.date)).all()
+        entries = Entry.query.filter_by(player_id=player_id).join(Session).options(
+            contains_eager(Entry.session), joinedload(Entry.player)
+        ).order_by(desc(Session.date)).all()
         
         history = []
         for entry in entries:
@@ -974,6 +1071,19 @@ class DatabaseService:
                 name="Unknown"
             )
         
+        return self.get_player_stats(player)
+    
+    def get_player_stats(self, player: Player) -> PlayerStats:
+        """
+        Calculate statistics for a player that has already been loaded.
+        
+        Args:
+            player: Player instance
+            
+        Returns:
+            PlayerStats instance with calculated statistics
+        """
+        player_id = player.player_id
         entries = Entry.query.filter_by(player_id=player_id).all()
         
         if not entries:
@@ -1018,7 +1128,7 @@ class DatabaseService:
         summary = []
         
         for player in players:
-            stats = self.get_player_overall_stats(player.player_id)
+            stats = self.get_player_stats(player)
             summary.append(stats)
         
         # Sort by net profit, highest first
@@ -1031,7 +1141,6 @@ class DatabaseService:
                               description: str = None, default_buy_in_value: float = 20.00,
                               max_players: int = None) -> Optional[CalendarEvent]:
         try:
-            from datetime import datetime
             datetime.strptime(date_str, "%Y-%m-%d")
 
             # Generate event_id
@@ -1054,7 +1163,7 @@ class DatabaseService:
 
             db.session.add(event)
             db.session.commit()
-            self.logger.info(f"Calendar event created: {event_id} on {date_str}")
+            self.logger.info("Calendar event created: %s on %s", event_id, date_str)
             return event
 
         except ValueError:
@@ -1062,14 +1171,13 @@ class DatabaseService:
             return None
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to create calendar event: {str(e)}")
+            self.logger.error("Failed to create calendar event: %s", e)
             return None
 
     def get_all_events(self) -> List[CalendarEvent]:
         return CalendarEvent.query.order_by(desc(CalendarEvent.date)).all()
 
     def get_upcoming_events(self, limit: int = 10) -> List[CalendarEvent]:
-        from datetime import datetime
         today = datetime.utcnow().strftime('%Y-%m-%d')
         return CalendarEvent.query.filter(
             CalendarEvent.date >= today
@@ -1096,11 +1204,11 @@ class DatabaseService:
                     setattr(event, field, value)
 
             db.session.commit()
-            self.logger.info(f"Calendar event {event_id} updated")
+            self.logger.info("Calendar event %s updated", event_id)
             return event
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to update calendar event {event_id}: {str(e)}")
+            self.logger.error("Failed to update calendar event %s: %s", event_id, e)
             return None
 
     def cancel_event(self, event_id: str) -> bool:
@@ -1110,11 +1218,11 @@ class DatabaseService:
                 return False
             event.is_cancelled = True
             db.session.commit()
-            self.logger.info(f"Calendar event {event_id} cancelled")
+            self.logger.info("Calendar event %s cancelled", event_id)
             return True
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to cancel event {event_id}: {str(e)}")
+            self.logger.error("Failed to cancel event %s: %s", event_id, e)
             return False
 
     def uncancel_event(self, event_id: str) -> bool:
@@ -1124,11 +1232,11 @@ class DatabaseService:
                 return False
             event.is_cancelled = False
             db.session.commit()
-            self.logger.info(f"Calendar event {event_id} uncancelled")
+            self.logger.info("Calendar event %s uncancelled", event_id)
             return True
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to uncancel event {event_id}: {str(e)}")
+            self.logger.error("Failed to uncancel event %s: %s", event_id, e)
             return False
 
     def delete_event(self, event_id: str) -> bool:
@@ -1138,28 +1246,28 @@ class DatabaseService:
                 return False
             db.session.delete(event)
             db.session.commit()
-            self.logger.info(f"Calendar event {event_id} deleted")
+            self.logger.info("Calendar event %s deleted", event_id)
             return True
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to delete event {event_id}: {str(e)}")
+            self.logger.error("Failed to delete event %s: %s", event_id, e)
             return False
 
     def create_or_update_rsvp(self, event_id: str, player_id: str, status: str) -> Optional[EventRSVP]:
         try:
             event = self.get_event_by_id(event_id)
             if not event:
-                self.logger.error(f"Event {event_id} not found for RSVP")
+                self.logger.error("Event %s not found for RSVP", event_id)
                 return None
 
             player = self.get_player_by_id(player_id)
             if not player:
-                self.logger.error(f"Player {player_id} not found for RSVP")
+                self.logger.error("Player %s not found for RSVP", player_id)
                 return None
 
             status = status.upper()
             if status not in ('YES', 'NO', 'MAYBE'):
-                self.logger.error(f"Invalid RSVP status: {status}")
+                self.logger.error("Invalid RSVP status: %s", status)
                 return None
 
             rsvp = EventRSVP.query.filter_by(
@@ -1177,11 +1285,11 @@ class DatabaseService:
                 db.session.add(rsvp)
 
             db.session.commit()
-            self.logger.info(f"RSVP for {player_id} to {event_id}: {status}")
+            self.logger.info("RSVP for %s to %s: %s", player_id, event_id, status)
             return rsvp
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to create/update RSVP: {str(e)}")
+            self.logger.error("Failed to create/update RSVP: %s", e)
             return None
 
     def delete_rsvp(self, event_id: str, player_id: str) -> bool:
@@ -1193,11 +1301,11 @@ class DatabaseService:
                 return False
             db.session.delete(rsvp)
             db.session.commit()
-            self.logger.info(f"RSVP deleted for {player_id} from {event_id}")
+            self.logger.info("RSVP deleted for %s from %s", player_id, event_id)
             return True
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to delete RSVP: {str(e)}")
+            self.logger.error("Failed to delete RSVP: %s", e)
             return False
 
     def get_event_rsvps(self, event_id: str) -> List[EventRSVP]:
@@ -1238,10 +1346,10 @@ class DatabaseService:
             db.session.commit()
 
             player = self.get_player_by_id(player_id)
-            self.logger.info(f"{player.name if player else player_id} seated in session {session_id} (0 buy-ins)")
+            self.logger.info("%s seated in session %s (0 buy-ins)", player.name if player else player_id, session_id)
             return new_entry
 
         except Exception as e:
             db.session.rollback()
-            self.logger.error(f"Failed to add player {player_id} to session {session_id}: {str(e)}")
+            self.logger.error("Failed to add player %s to session %s: %s", player_id, session_id, e)
             return None
@@ -81,9 +81,9 @@ class NotificationService:
                 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
                 public_key_bytes = v.public_key.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
                 browser_key = base64.urlsafe_b64encode(public_key_bytes).decode().rstrip('=')
-                self.logger.info(f"Frontend applicationServerKey: {browser_key}")
+                self.logger.info("Frontend applicationServerKey: %s", browser_key)
             except Exception as log_error:
-                self.logger.error(f"Failed to log public key for frontend: {log_error}")
+                self.logger.error("Failed to log public key for frontend: %s", log_error)
         else:
             # Keys exist, handle escaping if they were stored with \n
             vapid_private_key = vapid_private_key.replace('\\n', '\n')
@@ -163,7 +163,7 @@ class NotificationService:
             }
             
         except Exception as e:
-            self.logger.error(f"Error calculating session summary for {session_id}: {str(e)}")
+            self.logger.error("Error calculating session summary for %s: %s", session_id, e)
             return {"error": f"Failed to calculate session summary: {str(e)}"}
 
     def create_notification_content(self, session_summary: Dict[str, Any]) -> Dict[str, Any]:
@@ -264,7 +264,7 @@ class NotificationService:
                     vapid_claims=self.vapid_claims
                 )
                 
-                self.logger.info(f"Successfully sent notification to subscription {subscription.id}")
+                self.logger.info("Successfully sent notification to subscription %s", subscription.id)
                 return True
                 
             finally:
@@ -275,19 +275,19 @@ class NotificationService:
                     pass
             
         except WebPushException as e:
-            self.logger.error(f"WebPush error sending to subscription {subscription.id}: {str(e)}")
+            self.logger.error("WebPush error sending to subscription %s: %s", subscription.id, e)
             if e.response and e.response.status_code == 410:
                 # Subscription is no longer valid, deactivate it
                 subscription.is_active = False
                 db.session.commit()
-                self.logger.info(f"Deactivated invalid subscription {subscription.id}")
+                self.logger.info("Deactivated invalid subscription %s", subscription.id)
             elif e.response and e.response.status_code == 403:
                 # VAPID credentials mismatch - subscription was created with different keys
-                self.logger.warning(f"VAPID credentials mismatch for subscription {subscription.id} - subscription may need to be recreated")
+                self.logger.warning("VAPID credentials mismatch for subscription %s - subscription may need to be recreated", subscription.id)
             return False
             
         except Exception as e:
-            self.logger.error(f"Error sending notification to subscription {subscription.id}: {str(e)}")
+            self.logger.error("Error sending notification to subscription %s: %s", subscription.id, e)
             return False
 
     def send_session_end_notifications(self, session_id: str) -> Dict[str, Any]:
@@ -321,7 +321,7 @@ class NotificationService:
             ).all()
             
             if not subscriptions:
-                self.logger.info(f"No active subscriptions found for session {session_id}")
+                self.logger.info("No active subscriptions found for session %s", session_id)
                 return {
                     "success": True,
                     "message": "No subscribers to notify",
@@ -340,8 +340,8 @@ class NotificationService:
                     failed_count += 1
             
             self.logger.info(
-                f"Sent session end notifications for {session_id}: "
-                f"{sent_count} sent, {failed_count} failed"
+                "Sent session end notifications for %s: %s sent, %s failed",
+                session_id, sent_count, failed_count
             )
             
             return {
@@ -353,7 +353,7 @@ class NotificationService:
             }
             
         except Exception as e:
-            self.logger.error(f"Error sending session end notifications for {session_id}: {str(e)}")
+            self.logger.error("Error sending session end notifications for %s: %s", session_id, e)
             return {
                 "success": False,
                 "error": f"Failed to send notifications: {str(e)}",
@@ -375,7 +375,7 @@ class NotificationService:
         try:
             subscription = PushSubscription.query.get(subscription_id)
             if not subscription or not subscription.is_active:
-                self.logger.error(f"Subscription {subscription_id} not found or inactive")
+                self.logger.error("Subscription %s not found or inactive", subscription_id)
                 return False
             
             test_notification = {
@@ -388,5 +388,5 @@ class NotificationService:
             return self.send_notification_to_subscription(subscription, test_notification)
             
         except Exception as e:
-            self.logger.error(f"Error sending test notification to {subscription_id}: {str(e)}")
+            self.logger.error("Error sending test notification to %s: %s", subscription_id, e)
             return False
\ No newline at end of file
@@ -5,12 +5,53 @@ This module provides utilities for setting appropriate cache headers
 on API responses to ensure clients get fresh data when needed.
 """
 
-from typing import Dict, Any, Optional
-from flask import Response, jsonify
+from typing import Dict, Any, Optional, Tuple, Callable
+from flask import Flask, Response, jsonify, request, current_app
+from collections import OrderedDict
+import functools
 import hashlib
 import json
+import os
+import threading
 import time
 
+# Most responses kept in the in-process cache before the least recently used is evicted
+MAX_CACHED_RESPONSES = 256
+
+# In-process response cache: cache key -> (expires_at, body, mimetype, etag, persistent, generation)
+_response_cache: 'OrderedDict[str, Tuple[float, bytes, str, str, bool, int]]' = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def init_response_cache(app: Flask, stamp_path: str) -> None:
+    """
+    Share response cache invalidation between worker processes.
+    
+    Every invalidation appends a byte to the stamp file, so its size is a
+    generation counter all workers can read with a single stat() call.
+    Cached entries from an older generation are treated as expired.
+    
+    Args:
+        app: Flask application instance
+        stamp_path: File used to signal invalidations between processes
+    """
+    # Create the file if needed but never truncate it: another process may
+    # already hold entries tagged with the current generation, and a reset
+    # count would make them look fresh again once it grew back
+    open(stamp_path, 'ab').close()
+    app.config['RESPONSE_CACHE_STAMP'] = stamp_path
+
+
+def _cache_generation() -> int:
+    """Return the current shared invalidation generation (0 if not configured)."""
+    stamp_path = current_app.config.get('RESPONSE_CACHE_STAMP')
+    if not stamp_path:
+        return 0
+    try:
+        return os.stat(stamp_path).st_size
+    except OSError:
+        return 0
+
 
 def set_no_cache_headers(response: Response) -> Response:
     """
@@ -93,4 +134,74 @@ def api_response_no_cache(data: Any) -> Response:
     Returns:
         JSON response with no-cache headers
     """
-    return api_response_with_cache(data, max_age=0)
\ No newline at end of file
+    return api_response_with_cache(data, max_age=0)
+
+
+def cached_response(timeout: int = 30, persistent: bool = False,
+                    key_func: Optional[Callable[..., str]] = None) -> Callable:
+    """
+    Cache a GET view's successful response body in memory.
+    
+    Entries are keyed by request path and query string, or by key_func
+    called with the view's arguments when given. Non-persistent
+    entries are dropped by invalidate_response_cache() whenever data changes;
+    persistent entries are for views whose output never depends on stored
+    data and only expire after the timeout.
+    
+    Responses carry an ETag of the body, so clients that revalidate with
+    If-None-Match get an empty 304 while the data is unchanged.
+    
+    Args:
+        timeout: Cache duration in seconds
+        persistent: Whether the entry survives data-change invalidation
+        key_func: Builds the cache key from the view's arguments
+        
+    Returns:
+        Decorator for Flask view functions
+    """
+    def decorator(f: Callable) -> Callable:
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = key_func(*args, **kwargs) if key_func else request.full_path
+            now = time.monotonic()
+            
+            generation = 0 if persistent else _cache_generation()
+            
+            with _response_cache_lock:
+                cached = _response_cache.get(key)
+                fresh = cached is not None and cached[0] > now and cached[5] == generation
+                if fresh:
+                    _response_cache.move_to_end(key)
+            if fresh:
+                response = current_app.response_class(cached[1], mimetype=cached[2])
+                etag = cached[3]
+            else:
+                response = current_app.make_response(f(*args, **kwargs))
+                if response.status_code != 200 or response.direct_passthrough:
+                    return response
+                body = response.get_data()
+                etag = hashlib.md5(body).hexdigest()
+                with _response_cache_lock:
+                    _response_cache[key] = (now + timeout, body, response.mimetype, etag, persistent, generation)
+                    _response_cache.move_to_end(key)
+                    if len(_response_cache) > MAX_CACHED_RESPONSES:
+                        _response_cache.popitem(last=False)
+            
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response.make_conditional(request)
+        return decorated_function
+    return decorator
+
+
+def invalidate_response_cache() -> None:
+    """Drop all cached responses that depend on stored data, in every worker."""
+    with _response_cache_lock:
+        for key, cached in list(_response_cache.items()):
+            if not cached[4]:
+                del _response_cache[key]
+    
+    stamp_path = current_app.config.get('RESPONSE_CACHE_STAMP')
+    if stamp_path:
+        with open(stamp_path, 'ab') as f:
+            f.write(b'.')
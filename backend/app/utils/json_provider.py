@@ -0,0 +1,55 @@
+"""
+JSON provider for Poker Night PWA.
+
+This module provides a Flask JSON provider backed by orjson, so jsonify()
+and request.get_json() skip the stdlib json module when orjson is installed.
+"""
+
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    Types orjson doesn't handle the same way as Flask (dates, Markup) are
+    passed through to Flask's default handler, so responses keep the same shape.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        """Build the orjson option flags for a dump."""
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON to a string."""
+        if set(kwargs) - {'indent', 'separators'}:
+            # Options orjson doesn't support go through the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        options = self._options(indent=bool(kwargs.get('indent')))
+        return orjson.dumps(obj, default=self.default, option=options).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize data as JSON from a string or bytes."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        """Serialize the given arguments straight to a JSON response body."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._options(indent=indent)),
+            mimetype=self.mimetype
+        )
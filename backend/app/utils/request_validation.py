@@ -0,0 +1,87 @@
+"""
+Request validation helpers for Poker Night PWA.
+
+This module provides shared helpers for reading and validating API request input.
+"""
+
+import functools
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from flask import Response, abort, current_app, request
+
+# Largest JSON body the small fixed-shape endpoints (players, sessions,
+# entries, payouts) expect, in bytes
+MAX_JSON_BODY_SIZE = 4096
+
+# Longest player/session ID accepted in a URL (the columns hold at most 30)
+MAX_ID_LENGTH = 64
+
+
+def get_json_body(max_size: Optional[int] = None) -> Optional[Any]:
+    """
+    Parse the request's JSON body without raising on bad input.
+    
+    Malformed or non-JSON bodies return None so handlers can use their
+    usual "Request body is required" check. When max_size is given, a
+    larger body is rejected with a 413 before it is parsed.
+    
+    The Content-Type check is kept on purpose (no force=True): requiring
+    application/json means a cross-site form or text/plain POST can't reach
+    the cookie-authenticated admin endpoints without a CORS preflight.
+    
+    Args:
+        max_size: Largest body accepted, in bytes; no limit beyond
+            MAX_CONTENT_LENGTH when omitted
+    
+    Returns:
+        Parsed JSON data, or None if the body is missing or unusable
+    """
+    if max_size is not None and request.content_length and request.content_length > max_size:
+        abort(error_response("Request body too large", 413))
+    return request.get_json(silent=True, cache=False)
+
+
+@lru_cache(maxsize=128)
+def _error_body(message: str) -> bytes:
+    """Serialize an error payload once per distinct message."""
+    return json.dumps({"error": message}).encode('utf-8')
+
+
+def error_response(message: str, status: int) -> Response:
+    """
+    Build a JSON error response, reusing the serialized body across requests.
+    
+    A new Response is created every time because after_request hooks modify
+    response headers; only the encoded body is shared.
+    
+    Args:
+        message: Error message to return
+        status: HTTP status code
+        
+    Returns:
+        JSON response with the error message
+    """
+    return current_app.response_class(_error_body(message), status=status, mimetype='application/json')
+
+
+def validate_ids(f: Callable) -> Callable:
+    """
+    Reject oversized ID arguments captured from the URL.
+    
+    The <string:...> converter already guarantees every *_id argument is a
+    non-empty string without slashes, so only the length is checked here.
+    
+    Args:
+        f: Flask view function taking *_id URL arguments
+        
+    Returns:
+        Wrapped view function
+    """
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        for name, value in kwargs.items():
+            if name.endswith('_id') and len(value) > MAX_ID_LENGTH:
+                return error_response(f"Invalid {name[:-3]} ID", 400)
+        return f(*args, **kwargs)
+    return decorated_function
@@ -86,7 +86,7 @@ class DataTester:
         except Exception as e:
             test_results['passed'] = False
             test_results['errors'].append(f"Migration integrity test failed: {str(e)}")
-            self.logger.error(f"Migration integrity test failed: {str(e)}")
+            self.logger.error("Migration integrity test failed: %s", e)
         
         return test_results
     
@@ -106,7 +106,7 @@ class DataTester:
                         content = f.read()
                         data[table_name] = json.loads(content) if content.strip() else []
                 except Exception as e:
-                    self.logger.error(f"Error loading {filename}: {str(e)}")
+                    self.logger.error("Error loading %s: %s", filename, e)
                     data[table_name] = []
             else:
                 data[table_name] = []
@@ -57,7 +57,7 @@ class DataValidator:
         except Exception as e:
             validation_results['valid'] = False
             validation_results['errors'].append(f"Validation process failed: {str(e)}")
-            self.logger.error(f"Data validation failed: {str(e)}")
+            self.logger.error("Data validation failed: %s", e)
         
         return validation_results
     
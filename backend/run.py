@@ -2,7 +2,8 @@
 Main entry point for Poker Night PWA.
 
 This module serves as the main entry point for running the Flask application.
-It handles command-line arguments and starts the development server.
+It handles command-line arguments and starts the development server. Deployed
+instances run under gunicorn instead (see gunicorn.conf.py and wsgi.py).
 """
 
 import argparse
@@ -77,28 +78,21 @@ def main() -> None:
     """Main function to run the application."""
     args = parse_arguments()
     
-    # Debug: Print the port value being used
-    port_env = os.getenv('PORT')
-    print(f"PORT environment variable: {port_env}")
-    print(f"Using port: {args.port}")
-    
     # Get configuration class
     config_class = get_config_class(args.config)
     
-    # Create Flask application
+    # Create Flask application (create_app already applies the calculated
+    # template and static paths, so the config isn't rebuilt here)
     app = create_app(config_class)
     
-    # Configure Flask instance with calculated paths
-    config = config_class()
-    app.template_folder = config.TEMPLATE_DIR
-    app.static_folder = config.STATIC_DIR
-    
-    # Enable debug path logging if requested
-    if args.debug_paths:
-        config.log_paths_if_debug(debug_paths=True)
-    
     # Set up logging
     logger = logging.getLogger(__name__)
+    logger.debug("PORT environment variable: %s", os.getenv('PORT'))
+    logger.info("Using port: %s", args.port)
+    
+    # Enable debug path logging if requested
+    if args.debug_paths and logger.isEnabledFor(logging.INFO):
+        config_class().log_paths_if_debug(debug_paths=True)
     
     # Determine debug mode
     flask_debug_mode = args.debug or (args.config == 'development')
@@ -106,13 +100,13 @@ def main() -> None:
     # Log startup information
     if args.debug_paths:
         logger.info(
-            f"Flask app starting with debug_mode={flask_debug_mode} "
-            f"and --debug-paths enabled."
+            "Flask app starting with debug_mode=%s and --debug-paths enabled.",
+            flask_debug_mode
         )
     else:
         logger.info(
-            f"Flask app starting with debug_mode={flask_debug_mode}. "
-            f"Use --debug-paths to see path calculations."
+            "Flask app starting with debug_mode=%s. Use --debug-paths to see path calculations.",
+            flask_debug_mode
         )
     
     # Start the Flask development server
@@ -1,4 +1,19 @@
 import math
+from functools import lru_cache
+
+# Chip denominations (name, value in cents, weight), highest value first.
+# Weights set how many of each chip go into one "full weighted set".
+CHIP_DEFINITIONS = (
+    ("Black", 100, 10),
+    ("Blue", 50, 10),
+    ("Green", 20, 13),
+    ("Red", 10, 14),
+    ("White", 5, 20)
+)
+
+# Total value of one full weighted set of chips, in cents
+VALUE_OF_WEIGHTED_SET = sum(value * weight for _, value, weight in CHIP_DEFINITIONS)
+
 
 def calculate_chip_distribution(total_buy_in):
     """
@@ -20,52 +35,57 @@ def calculate_chip_distribution(total_buy_in):
         print("Error: Total buy-in must be a positive number.")
         return None
 
-    # Define the chip values and the desired weights for distribution
-    chip_definitions = [
-        ("Black", 1.00, 10),
-        ("Blue", 0.50, 10),
-        ("Green", 0.20, 13),
-        ("Red", 0.10, 14),
-        ("White", 0.05, 20)
-    ]
-    # Create a simple list of tuples for the greedy remainder calculation
-    chip_values_desc = [(name, val) for name, val, _ in chip_definitions]
-
-
     # --- New Algorithm for Weighted Stacks ---
     # To avoid floating point errors, we will work with cents.
     total_cents = int(round(total_buy_in * 100))
-    
-    # Calculate the total value of one "full weighted set" of chips in cents
-    value_of_weighted_set = sum(int(value * 100) * weight for _, value, weight in chip_definitions)
 
-    if value_of_weighted_set == 0:
-        print("Error: Chip values or weights cannot result in a zero-value set.")
-        return None
+    # Determine how many full weighted sets fit into the total buy-in,
+    # and the value left over after distributing them
+    num_sets, remaining_cents = divmod(total_cents, VALUE_OF_WEIGHTED_SET)
+
+    # Start each stack from the full sets, then distribute the remainder
+    # greedily (using largest chips first) on top of the base stacks.
+    chip_distribution = {}
+    for chip_name, chip_value_cents, weight in CHIP_DEFINITIONS:
+        additional_chips, remaining_cents = divmod(remaining_cents, chip_value_cents)
+        chip_distribution[chip_name] = num_sets * weight + additional_chips
 
-    # Determine how many full weighted sets fit into the total buy-in
-    num_sets = total_cents // value_of_weighted_set
-    
-    # Calculate the base distribution from the full sets
-    chip_distribution = {name: num_sets * weight for name, _, weight in chip_definitions}
-
-    # Calculate the remaining value after distributing the base sets
-    remaining_cents = total_cents % value_of_weighted_set
-
-    # Distribute the remainder greedily (using largest chips first)
-    # to add on top of the base stacks.
-    for chip_name, chip_value in chip_values_desc:
-        chip_value_cents = int(chip_value * 100)
-        if remaining_cents >= chip_value_cents:
-            additional_chips = remaining_cents // chip_value_cents
-            chip_distribution[chip_name] += additional_chips
-            remaining_cents -= additional_chips * chip_value_cents
-
-    print(f"\nCalculating weighted chip distribution for a buy-in of ${total_buy_in:.2f}...")
-    
     return chip_distribution
 
 
+@lru_cache(maxsize=128)
+def _distribution_for_cents(total_cents):
+    """Memoized core of cached_chip_data, keyed on whole cents."""
+    distribution = calculate_chip_distribution(total_cents / 100)
+    if not distribution:
+        return None
+    return tuple(distribution.items()), sum(distribution.values())
+
+
+def cached_chip_data(total_buy_in):
+    """
+    Memoized chip distribution for a buy-in, along with its total chip count.
+
+    Buy-ins repeat across sessions ($20, $40, ...), so results are cached on
+    the buy-in rounded to cents, which is the precision the calculation works
+    at anyway. The total is summed once per cached buy-in, and a new
+    dictionary is returned on every call so callers can't alter the cached
+    result.
+
+    Args:
+        total_buy_in (float): The total monetary value of the buy-in.
+
+    Returns:
+        dict: {'distribution': <same as calculate_chip_distribution>,
+        'total': <number of chips>}, or None if no distribution was found.
+    """
+    cached = _distribution_for_cents(int(round(total_buy_in * 100)))
+    if cached is None:
+        return None
+    items, total = cached
+    return {'distribution': dict(items), 'total': total}
+
+
 def display_distribution(distribution):
     """Prints the chip distribution in a user-friendly format."""
     if not distribution:
@@ -94,6 +114,7 @@ if __name__ == "__main__":
         buy_in_input = float(input("Enter the total buy-in amount (e.g., 20.00): "))
 
         # Calculate the distribution
+        print(f"\nCalculating weighted chip distribution for a buy-in of ${buy_in_input:.2f}...")
         final_distribution = calculate_chip_distribution(buy_in_input)
 
         # Display the result
@@ -0,0 +1,19 @@
+"""
+WSGI entry point for Poker Night PWA.
+
+This module exposes the Flask application for production WSGI servers such as
+gunicorn. Use run.py for local development with the Flask development server.
+"""
+
+import os
+
+# Load environment variables from .env file
+from dotenv import load_dotenv
+# Load from project root .env file
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+load_dotenv(os.path.join(project_root, '.env'))
+
+from app import create_app
+from app.config import ProductionConfig
+
+application = create_app(ProductionConfig)
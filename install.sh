@@ -58,7 +58,7 @@ if [ "$DEPLOYMENT_MODE" = "deployment" ]; then
         $APP_DIR/venv/bin/pip install -r "$SCRIPT_DIR/requirements.txt"
     else
         echo "Warning: requirements.txt not found in git repo."
-        $APP_DIR/venv/bin/pip install Flask Flask-SQLAlchemy Werkzeug python-dotenv pywebpush py-vapid cryptography
+        $APP_DIR/venv/bin/pip install Flask Flask-SQLAlchemy Werkzeug python-dotenv gunicorn orjson pywebpush py-vapid cryptography
     fi
     
 elif [ "$DEPLOYMENT_MODE" = "production" ]; then
@@ -78,7 +78,7 @@ elif [ "$DEPLOYMENT_MODE" = "production" ]; then
         $APP_DIR/venv/bin/pip install -r "$APP_DIR/requirements.txt"
     else
         echo "Warning: requirements.txt not found in production app."
-        $APP_DIR/venv/bin/pip install --upgrade Flask Flask-SQLAlchemy Werkzeug python-dotenv pywebpush py-vapid cryptography
+        $APP_DIR/venv/bin/pip install --upgrade Flask Flask-SQLAlchemy Werkzeug python-dotenv gunicorn orjson pywebpush py-vapid cryptography
     fi
 fi
 
@@ -120,7 +120,7 @@ Description=Poker Night Application
 After=network.target
 
 [Service]
-ExecStart=$APP_DIR/venv/bin/python $APP_DIR/backend/run.py
+ExecStart=$APP_DIR/venv/bin/gunicorn --chdir $APP_DIR/backend -c $APP_DIR/backend/gunicorn.conf.py wsgi:application
 Restart=always
 RestartSec=3
 User=root